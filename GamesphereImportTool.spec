@@ -18,6 +18,13 @@ hidden_imports = [
     'dotenv',
     'glob2',
 ]
+# Optional speedups: bundled only if installed in the build environment
+for _optional in ('orjson', 'pythoncom', 'win32com.client'):
+    try:
+        __import__(_optional)
+        hidden_imports.append(_optional)
+    except ImportError:
+        pass
 
 # Bundle GameSphere theme and logo (used by GUI)
 # In .spec files __file__ is not set. PyInstaller injects SPEC (path to this .spec file).
@@ -3,7 +3,11 @@ Gamesphere Import Tool — Windows GUI.
 Configure paths, API key, and run the importer for Sunshine or Apollo.
 """
 
+import codecs
+import io
+import mmap
 import os
+import re
 import subprocess
 import sys
 import threading
@@ -25,8 +29,8 @@ def _request_admin_and_rerun():
         pass
 
 # Try CustomTkinter for modern look; fall back to tkinter
+# messagebox, filedialog and scrolledtext are imported where first used
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, filedialog
 try:
     import customtkinter as ctk
     HAS_CTK = True
@@ -48,6 +52,12 @@ ENV_KEYS = {
     "SUNSHINE_SHORTCUTS_FOLDER": "Shortcuts folder (optional)",
 }
 
+_ENV_KEYS_SET = frozenset(ENV_KEYS)
+
+# Keys whose row gets a Browse… button, and which of those pick a file rather than a folder
+NEEDS_BROWSE = frozenset(k for k in ENV_KEYS if any(t in k.lower() for t in ("path", "folder", "json")))
+BROWSE_IS_FILE = frozenset(k for k in NEEDS_BROWSE if "json" in k or "vdf" in k)
+
 # Default Windows paths per streaming host (main.py uses same env var names for both)
 HOST_DEFAULTS = {
     "sunshine": {
@@ -79,77 +89,225 @@ HOST_DEFAULTS = {
 # For backwards compatibility (default host)
 DEFAULTS = HOST_DEFAULTS["sunshine"]
 
+# Host-specific fields and their defaults, per host; applied when the host is switched
+HOST_DEFAULT_ITEMS = {
+    host: tuple(
+        (key, defaults.get(key, ""))
+        for key in ("sunshine_apps_json_path", "sunshine_grids_folder", "SUNSHINE_EXE_PATH")
+    )
+    for host, defaults in HOST_DEFAULTS.items()
+}
+
+
+# Resolved once at import; neither the exe location nor __file__ changes at runtime
+_BASE_DIR = (
+    os.path.dirname(sys.executable) if getattr(sys, "frozen", False)
+    else os.path.dirname(os.path.abspath(__file__))
+)
+_DOTENV_PATH = os.path.join(_BASE_DIR, ".env")
+
 
 def _base_dir():
     """Base directory for .env and main.py (script dir, or exe dir when frozen)."""
-    if getattr(sys, "frozen", False):
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.abspath(__file__))
+    return _BASE_DIR
 
 
 def get_dotenv_path():
     """Path to .env in the same directory as this script (or the .exe when frozen)."""
-    return os.path.join(_base_dir(), ".env")
+    return _DOTENV_PATH
+
+
+# One KEY=value assignment per line; comment lines never match (key must start the line).
+# Value is "double" or 'single' quoted (groups 2/3) or bare (group 4), optionally followed
+# by a " # comment". Only [ \t] is used as whitespace so a value never runs onto the next line.
+_ENV_LINE_RE = re.compile(
+    rb"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    rb"(?:\"([^\"\r\n]*)\"|'([^'\r\n]*)'|([^\r\n]*?))"
+    rb"[ \t]*(?:[ \t]#[^\r\n]*)?\r?$"
+)
+
+# Parsed .env keyed by path -> ((mtime_ns, size), values, host); see load_env_from_file
+_ENV_CACHE = {}
+
+
+def _env_stamp(path):
+    """(mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
 def load_env_from_file():
     """Load key=value pairs from .env into a dict. Returns (values_dict, host)."""
     path = get_dotenv_path()
+    stamp = _env_stamp(path)
+    cached = _ENV_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return dict(cached[1]), cached[2]
     out = dict(DEFAULTS)
     host = "sunshine"
-    if not os.path.exists(path):
+    if stamp is None:
         return out, host
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # mmap refuses empty files; an empty .env just means defaults
+        data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ) if stamp[1] else b""
+    finally:
+        os.close(fd)
+    try:
+        # findall hands back plain tuples; an unmatched alternative is b"", and at most
+        # one of the three value groups can be non-empty
+        for key, dq, sq, raw in _ENV_LINE_RE.findall(data):
+            key = key.decode("utf-8")
+            value = (dq or sq or raw).decode("utf-8", errors="replace")
+            if key == "HOST":
+                host = value.lower() if value.lower() in ("sunshine", "apollo") else "sunshine"
                 continue
-            if "=" in line:
-                key, _, value = line.partition("=")
-                key, value = key.strip(), value.strip()
-                if key == "HOST":
-                    host = value.lower() if value.lower() in ("sunshine", "apollo") else "sunshine"
-                    continue
-                if key in ENV_KEYS:
-                    # Remove surrounding quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    if value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    out[key] = value
+            if key in _ENV_KEYS_SET:
+                out[key] = value
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    _ENV_CACHE[path] = (stamp, dict(out), host)
     return out, host
 
 
+def invalidate_env_cache(path=None):
+    """Forget the parsed .env for path (or every cached path) so the next load re-reads it."""
+    if path is None:
+        _ENV_CACHE.clear()
+    else:
+        _ENV_CACHE.pop(path, None)
+
+
+def _file_content_equals(path, content):
+    """True if the file at path holds exactly content (bytes); compared via a read-only mmap."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        size = os.fstat(fd).st_size
+        if size != len(content):
+            return False
+        if not size:
+            return True
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:] == content
+    finally:
+        os.close(fd)
+
+
+def _quote(val):
+    """Quote a .env value that would otherwise be cut at a space or read as a comment."""
+    return f'"{val}"' if " " in val or "#" in val else val
+
+
+_ENV_HEADER = (
+    "# Gamesphere Import Tool configuration\n"
+    "# Edit here or use the GUI. HOST = sunshine | apollo\n"
+    "\n"
+)
+
+
 def save_env_to_file(values, host="sunshine"):
     """Write config dict to .env."""
     path = get_dotenv_path()
-    lines = [
-        "# Gamesphere Import Tool configuration",
-        "# Edit here or use the GUI. HOST = sunshine | apollo",
-        "",
-        f"HOST={host}",
-        "",
-    ]
-    for key in ENV_KEYS:
-        val = values.get(key, "")
-        if " " in val or "#" in val:
-            val = f'"{val}"'
-        lines.append(f"{key}={val}")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    content = (
+        f"{_ENV_HEADER}HOST={host}\n\n"
+        + "".join(f"{key}={_quote(values.get(key, ''))}\n" for key in ENV_KEYS)
+    ).encode("utf-8")
+    # Repeated saves with nothing changed skip the truncate+write (and the AV scan it triggers)
+    if not _file_content_equals(path, content):
+        # Drop the old entry first so a failed write can't leave it looking current
+        invalidate_env_cache(path)
+        # Write a sibling and rename over .env so a reader never sees a half-written file
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    # Seed the cache with what we just wrote so the next load skips the parse
+    out = dict(DEFAULTS)
+    out.update((key, values.get(key, "")) for key in ENV_KEYS)
+    _ENV_CACHE[path] = (_env_stamp(path), out, host)
+
+
+# Partial-line text QueueWriter holds back before pushing it anyway
+_QUEUE_WRITER_MAX_PENDING = 4096
+
+
+class QueueWriter(io.TextIOBase):
+    """Line-buffered text stream for the in-process importer: only complete lines, flushes,
+    or more than _QUEUE_WRITER_MAX_PENDING chars of a partial line reach the queue."""
+
+    def __init__(self, q):
+        super().__init__()
+        self._q = q
+        self._parts = []
+        self._len = 0
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        if not s:
+            return 0
+        if "\n" in s:
+            head, sep, rest = s.rpartition("\n")
+            self._parts.append(head + sep)
+            self._q.put(("out", "".join(self._parts)))
+            self._parts = [rest] if rest else []
+            self._len = len(rest)
+        else:
+            self._parts.append(s)
+            self._len += len(s)
+            if self._len > _QUEUE_WRITER_MAX_PENDING:
+                self.flush()
+        return len(s)
+
+    def writelines(self, lines):
+        self.write("".join(lines))
+
+    def flush(self):
+        if self._parts:
+            self._q.put(("out", "".join(self._parts)))
+            self._parts = []
+            self._len = 0
+
+
+# main module, imported on the first in-process run and reused afterwards (see _get_main)
+_main_mod = None
+
+
+def _get_main():
+    """The importer's main module, imported on first use."""
+    global _main_mod
+    if _main_mod is None:
+        import main as _main_mod
+    return _main_mod
+
+
+def _importer_flags(remove_games, dry_run, verbose, no_restart):
+    """main.py command-line flags for the selected options, as a tuple."""
+    return tuple(flag for flag, on in (
+        ("--remove-games", remove_games),
+        ("--dry-run", dry_run),
+        ("--verbose", verbose),
+        ("--no-restart", no_restart),
+    ) if on)
 
 
 def _run_importer_in_process(env_vars, dry_run, verbose, no_restart, log_queue, remove_games=False):
     """Run the importer in-process (used when frozen as .exe). Captures stdout to log_queue."""
-    class QueueWriter:
-        def __init__(self, q):
-            self._q = q
-        def write(self, s):
-            if s:
-                self._q.put(("out", s))
-        def flush(self):
-            pass
-
+    # Import before redirecting stdout, so module-load output doesn't go through the queue
+    try:
+        main_mod = _get_main()
+    except Exception as e:
+        log_queue.put(("err", f"Could not load the importer: {e}\n"))
+        log_queue.put(("done",))
+        return
     base_dir = _base_dir()
     old_cwd = os.getcwd()
     old_stdout, old_stderr = sys.stdout, sys.stderr
@@ -157,19 +315,10 @@ def _run_importer_in_process(env_vars, dry_run, verbose, no_restart, log_queue,
     sys.stdout, sys.stderr = out, out
     try:
         os.chdir(base_dir)
-        for k, v in env_vars.items():
-            if v:
-                os.environ[k] = str(v)
-        sys.argv = ["main.py"]
-        if remove_games:
-            sys.argv.append("--remove-games")
-        if dry_run:
-            sys.argv.append("--dry-run")
-        if verbose:
-            sys.argv.append("--verbose")
-        if no_restart:
-            sys.argv.append("--no-restart")
-        import main as main_mod
+        # Only touch variables whose value changes (each assignment is a putenv call);
+        # values come from Entry.get(), so they are already str
+        os.environ.update({k: v for k, v in env_vars.items() if v and os.environ.get(k) != v})
+        sys.argv = ["main.py", *_importer_flags(remove_games, dry_run, verbose, no_restart)]
         main_mod.main()
     except SystemExit as e:
         if e.code and e.code != 0:
@@ -177,11 +326,41 @@ def _run_importer_in_process(env_vars, dry_run, verbose, no_restart, log_queue,
     except Exception as e:
         log_queue.put(("err", str(e) + "\n"))
     finally:
+        out.flush()
         sys.stdout, sys.stderr = old_stdout, old_stderr
         os.chdir(old_cwd)
     log_queue.put(("done",))
 
 
+# Bytes per os.read() on the importer's stdout pipe
+_PIPE_READ_SIZE = 65536
+
+# Interpreter for the importer subprocess, resolved once
+_PYTHON_EXE = sys.executable
+
+# Windows: no console window for the child, and skip the handle-inheritance sweep.
+# Linux: a 1 MiB pipe (the default unprivileged pipe-max-size) so a chatty child
+# rarely blocks on a full 64 KiB pipe while the reader thread waits for the GIL.
+if sys.platform == "win32":
+    _POPEN_PLATFORM_KWARGS = {"close_fds": False, "creationflags": subprocess.CREATE_NO_WINDOW}
+elif sys.platform.startswith("linux") and sys.version_info >= (3, 10):
+    _POPEN_PLATFORM_KWARGS = {"pipesize": 1 << 20}
+else:
+    _POPEN_PLATFORM_KWARGS = {}
+
+
+class LogQueue(queue.Queue):
+    """Queue that calls on_put after every put, so the GUI can drain on demand instead of polling."""
+
+    def __init__(self, on_put):
+        super().__init__()
+        self._on_put = on_put
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self._on_put()
+
+
 def run_automation(env_vars, dry_run, verbose, no_restart, log_queue, remove_games=False):
     """Run main.py in a subprocess (or in-process when frozen) and push lines to log_queue. Puts ("done",) when finished."""
     base_dir = _base_dir()
@@ -196,19 +375,8 @@ def run_automation(env_vars, dry_run, verbose, no_restart, log_queue, remove_gam
         log_queue.put(("err", "main.py not found.\n"))
         log_queue.put(("done",))
         return
-    env = os.environ.copy()
-    for k, v in env_vars.items():
-        if v:
-            env[k] = v
-    cmd = [sys.executable, main_py]
-    if remove_games:
-        cmd.append("--remove-games")
-    if dry_run:
-        cmd.append("--dry-run")
-    if verbose:
-        cmd.append("--verbose")
-    if no_restart:
-        cmd.append("--no-restart")
+    env = {**os.environ, **{k: v for k, v in env_vars.items() if v}}
+    cmd = [_PYTHON_EXE, main_py, *_importer_flags(remove_games, dry_run, verbose, no_restart)]
     try:
         proc = subprocess.Popen(
             cmd,
@@ -216,12 +384,26 @@ def run_automation(env_vars, dry_run, verbose, no_restart, log_queue, remove_gam
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
+            bufsize=0,
+            **_POPEN_PLATFORM_KWARGS,
         )
-        for line in proc.stdout:
-            log_queue.put(("out", line))
+        # Read raw pipe chunks and decode once per chunk; the incremental decoder
+        # keeps multi-byte characters split across reads intact
+        fd = proc.stdout.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        tail = ""
+        while True:
+            chunk = os.read(fd, _PIPE_READ_SIZE)
+            *lines, tail = (tail + decoder.decode(chunk, final=not chunk)).split("\n")
+            if lines:
+                # One queue item per read, not per line; the GUI drains it in one insert
+                text = "\n".join(lines) + "\n"
+                log_queue.put(("out", text.replace("\r\n", "\n") if "\r" in text else text))
+            if not chunk:
+                break
+        if tail:
+            log_queue.put(("out", tail))
+        proc.stdout.close()
         proc.wait()
         if proc.returncode != 0:
             log_queue.put(("err", f"\nProcess exited with code {proc.returncode}\n"))
@@ -266,21 +448,68 @@ def _icon_path():
     return os.path.join(root, "assets", "gamesphere_logo.png")
 
 
+def _icon_cache_path(png_path):
+    """Cached .ico for png_path in a user-writable dir; the PNG's size in the name invalidates stale icons."""
+    cache_root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    name = f"gamesphere_logo_{os.stat(png_path).st_size}.ico"
+    return os.path.join(cache_root, "GamesphereImportTool", name)
+
+
 # GameSphere gradient (lighter top -> darker bottom, from app icon)
 _GS_GRADIENT_TOP = "#C42E1A"
 _GS_GRADIENT_BOTTOM = "#8B1A10"
 
 
 def _hex_to_rgb(hex_str):
-    h = hex_str.lstrip("#")
-    return tuple(int(h[i : i + 2], 16) for i in (0, 2, 4))
+    return tuple(bytes.fromhex(hex_str.lstrip("#")))
 
 
 def _rgb_to_hex(r, g, b):
-    return "#{:02x}{:02x}{:02x}".format(int(r), int(g), int(b))
+    return "#%02x%02x%02x" % (int(r), int(g), int(b))
+
+
+def _gradient_ramp(start, end, n=256):
+    """n hex colors interpolated from start to end (inclusive)."""
+    r1, g1, b1 = _hex_to_rgb(start)
+    r2, g2, b2 = _hex_to_rgb(end)
+    return tuple(
+        _rgb_to_hex(r1 + (r2 - r1) * i / (n - 1), g1 + (g2 - g1) * i / (n - 1), b1 + (b2 - b1) * i / (n - 1))
+        for i in range(n)
+    )
+
+
+# Dark at top, light at bottom; drawn rows index into this instead of interpolating
+_GRADIENT_COLORS = _gradient_ramp(_GS_GRADIENT_BOTTOM, _GS_GRADIENT_TOP)
+
+
+# Keys the log widget still honours: navigation, plus copy / select-all with Ctrl or Cmd
+_LOG_NAV_KEYS = frozenset((
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Meta_L", "Meta_R",
+))
+_LOG_SHORTCUT_KEYS = frozenset(("c", "C", "a", "A", "Insert"))
+
+
+def _log_key_filter(event):
+    """<Key> handler that makes the log Text read-only without toggling its state."""
+    if event.keysym in _LOG_NAV_KEYS:
+        return None
+    # 0x4 = Control, 0x8 = Command on macOS (Mod1)
+    if event.state & 0x4 or (sys.platform == "darwin" and event.state & 0x8):
+        if event.keysym in _LOG_SHORTCUT_KEYS:
+            return None
+    return "break"
+
+
+# Log widget keeps at most this many lines; the line count is checked every N appends
+_LOG_MAX_LINES = 5000
+_LOG_TRIM_EVERY = 10
 
 
 class SunshineGUI:
+    # Shared by every window on the same Tk interpreter; created on first use
+    _icon_img = None
+
     def __init__(self):
         if HAS_CTK:
             ctk.set_appearance_mode("dark")
@@ -299,39 +528,63 @@ class SunshineGUI:
         self.run_btn = None
         self.remove_games_btn = None
         self.log_text = None
-        self.log_queue = queue.Queue()
+        self.log_queue = LogQueue(self._schedule_log_drain)
+        self._log_drain_pending = False
+        self._pending_log_parts = []
+        self._log_apply_pending = False
+        self._log_appends = 0
         self.running = False
 
+        self._browse_rows = []
+
         self._build_ui()
-        self._load_config()
-        self._poll_log()
+        # Paint first, then fill the fields once .env has been read off the UI thread
+        self.root.after(10, self._kick_load_config)
+        # Idle callbacks run in order, so this lands after the first redraw of the window
+        self.root.after_idle(self.root.after, 0, self._create_browse_buttons)
 
     def _set_app_icon(self):
         path = _icon_path()
         if not os.path.exists(path):
             return
         try:
-            from tkinter import PhotoImage
-            self._icon_img = PhotoImage(file=path)
-            self.root.iconphoto(True, self._icon_img)
-            # Windows taskbar/alt-tab use .ico; create from PNG if we have PIL
-            if sys.platform == "win32":
-                try:
-                    import tempfile
-                    from PIL import Image
-                    img = Image.open(path).convert("RGBA")
-                    ico_path = os.path.join(os.path.dirname(path), "gamesphere_logo.ico")
-                    if not os.path.exists(ico_path):
-                        try:
-                            img.save(ico_path, format="ICO", sizes=[(32, 32), (16, 16)])
-                        except OSError:
-                            fd, ico_path = tempfile.mkstemp(suffix=".ico")
-                            os.close(fd)
-                            img.save(ico_path, format="ICO", sizes=[(32, 32), (16, 16)])
-                    if os.path.exists(ico_path):
-                        self.root.iconbitmap(ico_path)
-                except Exception:
-                    pass
+            img = SunshineGUI._icon_img
+            if img is None or img.tk is not self.root.tk:
+                from tkinter import PhotoImage
+                img = SunshineGUI._icon_img = PhotoImage(master=self.root, file=path)
+            self.root.iconphoto(True, img)
+        except Exception:
+            return
+        # Windows taskbar/alt-tab use .ico; reuse the cached one, else build it off the UI thread
+        # so the PIL import doesn't delay first paint
+        if sys.platform == "win32":
+            try:
+                ico_path = _icon_cache_path(path)
+                if os.path.exists(ico_path):
+                    self.root.iconbitmap(ico_path)
+                    return
+            except Exception:
+                return
+            threading.Thread(target=self._build_ico, args=(path, ico_path), daemon=True).start()
+
+    def _build_ico(self, path, ico_path):
+        """Worker thread: create the cached .ico from the PNG if we have PIL, then apply it on the Tk thread."""
+        try:
+            import tempfile
+            from PIL import Image
+            img = Image.open(path)
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+            try:
+                os.makedirs(os.path.dirname(ico_path), exist_ok=True)
+                # Write then rename so an interrupted save never leaves a truncated cached icon
+                img.save(ico_path + ".tmp", format="ICO", sizes=[(32, 32), (16, 16)])
+                os.replace(ico_path + ".tmp", ico_path)
+            except OSError:
+                fd, ico_path = tempfile.mkstemp(suffix=".ico")
+                os.close(fd)
+                img.save(ico_path, format="ICO", sizes=[(32, 32), (16, 16)])
+            self.root.after(0, lambda: self.root.iconbitmap(ico_path))
         except Exception:
             pass
 
@@ -383,10 +636,10 @@ class SunshineGUI:
         if host not in HOST_DEFAULTS:
             host = "sunshine"
         self.host_var.set(host.capitalize())
-        defaults = HOST_DEFAULTS[host]
-        for key in ("sunshine_apps_json_path", "sunshine_grids_folder", "SUNSHINE_EXE_PATH"):
-            self.entries[key].delete(0, "end")
-            self.entries[key].insert(0, defaults.get(key, ""))
+        for key, value in HOST_DEFAULT_ITEMS[host]:
+            entry = self.entries[key]
+            entry.delete(0, "end")
+            entry.insert(0, value)
         self._update_host_buttons()
 
     def _update_host_buttons(self):
@@ -411,30 +664,34 @@ class SunshineGUI:
     def _draw_gradient(self, w, h):
         if not getattr(self, "_gradient_canvas", None):
             return
-        c = self._gradient_canvas
-        c.delete("gradient")
         if w <= 0 or h <= 0:
             return
-        # Dark at top, light at bottom
-        r1, g1, b1 = _hex_to_rgb(_GS_GRADIENT_BOTTOM)
-        r2, g2, b2 = _hex_to_rgb(_GS_GRADIENT_TOP)
+        # Resize storms: the bands are horizontal, so the image is built screen-wide once and only a
+        # height drift of >16px (or a window wider than the screen) rebuilds it
+        img = getattr(self, "_grad_img", None)
+        if img is not None and w <= img.width() and abs(h - img.height()) <= 16:
+            return
+        c = self._gradient_canvas
+        w = max(w, c.winfo_screenwidth())
         steps = max(2, min(80, h // 4))
         step = h / steps
+        last = len(_GRADIENT_COLORS) - 1
+        img = tk.PhotoImage(master=c, width=w, height=h)
         for i in range(steps):
-            t = i / (steps - 1) if steps > 1 else 1
-            r = r1 + (r2 - r1) * t
-            g = g1 + (g2 - g1) * t
-            b = b1 + (b2 - b1) * t
-            color = _rgb_to_hex(r, g, b)
-            y1, y2 = i * step, (i + 1) * step
-            c.create_rectangle(0, y1, w, y2, fill=color, outline="", tags=("gradient",))
+            color = _GRADIENT_COLORS[i * last // (steps - 1)]
+            img.put(color, to=(0, int(i * step), w, int((i + 1) * step)))
+        self._grad_img = img
+        c.delete("gradient")
+        c.create_image(0, 0, image=img, anchor="nw", tags=("gradient",))
+        c.tag_lower("gradient")
 
     def _build_ui(self):
         # Red gradient background (canvas behind content)
+        # bg matches the gradient's last row so growth inside the redraw hysteresis is seamless
         self._gradient_canvas = tk.Canvas(
             self.root,
             highlightthickness=0,
-            bg=_GS_GRADIENT_BOTTOM,
+            bg=_GS_GRADIENT_TOP,
         )
         self._gradient_canvas.pack(fill="both", expand=True)
         main = self._gradient_frame(self._gradient_canvas)
@@ -485,20 +742,9 @@ class SunshineGUI:
             self.entries[key] = entry
             if "optional" in label.lower():
                 self._label(row, text="(optional)", font=_gs_font(9)).pack(side="left", padx=(8, 8))
-            # Browse button for paths
-            if "path" in key.lower() or "folder" in key.lower() or "json" in key.lower():
-                def make_browse(e=entry, is_file=("json" in key or "vdf" in key)):
-                    def browse():
-                        if is_file:
-                            path = filedialog.askopenfilename()
-                        else:
-                            path = filedialog.askdirectory()
-                        if path:
-                            e.delete(0, "end")
-                            e.insert(0, path)
-                    return browse
-                btn = self._button(row, "Browse…", make_browse())
-                btn.pack(side="right")
+            # Browse button for paths; created after first paint (see _create_browse_buttons)
+            if key in NEEDS_BROWSE:
+                self._browse_rows.append((row, entry, key in BROWSE_IS_FILE))
 
         # Options
         opt_frame = self._gradient_frame(main)
@@ -524,14 +770,42 @@ class SunshineGUI:
         self._label(main, text="Log", font=_gs_font(14, "bold")).pack(anchor="w")
         log_frame = self._gradient_frame(main)
         log_frame.pack(fill="both", expand=True, pady=4)
+        from tkinter import scrolledtext
         self.log_text = scrolledtext.ScrolledText(
-            log_frame, wrap="word", height=22, state="disabled",
+            log_frame, wrap="word", height=22,
             font=("Consolas", 14) if sys.platform == "win32" else ("Monaco", 14),
         )
+        # Left in "normal" state so writes need no configure() toggles; user edits are swallowed instead
+        self.log_text.bind("<Key>", _log_key_filter)
+        for event in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>"):
+            self.log_text.bind(event, lambda e: "break")
         self.log_text.pack(fill="both", expand=True)
 
-    def _load_config(self):
-        values, host = load_env_from_file()
+    def _create_browse_buttons(self):
+        """Add the Browse… buttons once the window has painted; they aren't needed for first paint."""
+        for row, entry, is_file in self._browse_rows:
+            self._button(row, "Browse…", lambda e=entry, f=is_file: self._browse(e, f)).pack(side="right")
+        self._browse_rows = []
+
+    def _browse(self, entry, is_file):
+        from tkinter import filedialog
+        path = filedialog.askopenfilename() if is_file else filedialog.askdirectory()
+        if path:
+            entry.delete(0, "end")
+            entry.insert(0, path)
+
+    def _kick_load_config(self):
+        threading.Thread(target=self._load_config_worker, daemon=True).start()
+
+    def _load_config_worker(self):
+        """Worker thread: parse .env (no Tk calls here) and hand the result to the Tk thread."""
+        try:
+            values, host = load_env_from_file()
+        except OSError:
+            values, host = dict(DEFAULTS), "sunshine"
+        self.root.after(0, lambda: self._apply_loaded_config(values, host))
+
+    def _apply_loaded_config(self, values, host):
         for key, entry in self.entries.items():
             entry.delete(0, "end")
             entry.insert(0, values.get(key, ""))
@@ -546,10 +820,12 @@ class SunshineGUI:
         return raw if raw in ("sunshine", "apollo") else "sunshine"
 
     def _save_config(self):
+        from tkinter import messagebox
         save_env_to_file(self._get_values(), self._get_host())
         messagebox.showinfo("Saved", "Configuration saved to .env")
 
     def _on_run(self):
+        from tkinter import messagebox
         if self.running:
             return
         values = self._get_values()
@@ -570,11 +846,8 @@ class SunshineGUI:
         save_env_to_file(values, self._get_host())
         self.running = True
         self.run_btn.configure(state="disabled")
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        self.log_text.insert("end", "Running...\n\n")
-        self.log_text.configure(state="disabled")
-        self.log_queue = queue.Queue()
+        self._append_log("Running...\n\n", clear=True)
+        self._discard_queued_log()
         thread = threading.Thread(
             target=run_automation,
             args=(
@@ -590,6 +863,7 @@ class SunshineGUI:
 
     def _on_remove_games(self):
         """Remove all games (Steam + manually added); keep only stock apps (Desktop, Steam, Virtual Display)."""
+        from tkinter import messagebox
         if self.running:
             return
         values = self._get_values()
@@ -606,11 +880,8 @@ class SunshineGUI:
         self.running = True
         self.run_btn.configure(state="disabled")
         self.remove_games_btn.configure(state="disabled")
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        self.log_text.insert("end", "Removing all games (keeping stock apps only)...\n\n")
-        self.log_text.configure(state="disabled")
-        self.log_queue = queue.Queue()
+        self._append_log("Removing all games (keeping stock apps only)...\n\n", clear=True)
+        self._discard_queued_log()
         thread = threading.Thread(
             target=run_automation,
             args=(
@@ -625,30 +896,82 @@ class SunshineGUI:
         )
         thread.start()
 
-    def _poll_log(self):
+    def _discard_queued_log(self):
+        """Empty the shared log queue before a new run (the queue lives for the app's lifetime)."""
+        self._pending_log_parts.clear()
+        try:
+            while True:
+                self.log_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _schedule_log_drain(self):
+        """Called from the worker thread on every put; queues at most one pending drain on the Tk loop."""
+        if not self._log_drain_pending:
+            self._log_drain_pending = True
+            self.root.after_idle(self._drain_log)
+
+    def _append_log(self, text, clear=False):
+        """Write text to the log widget (read-only to the user via _log_key_filter)."""
+        log = self.log_text
+        if clear:
+            log.delete("1.0", "end")
+        log.insert("end", text)
+        if not clear:
+            self._log_appends += 1
+            if self._log_appends % _LOG_TRIM_EVERY == 0:
+                # Keep the widget bounded; Tk re-lays out the whole buffer on every insert/see
+                if int(log.index("end-1c").split(".")[0]) > _LOG_MAX_LINES:
+                    log.delete("1.0", f"end-{_LOG_MAX_LINES}l")
+            log.see("end")
+
+    def _drain_log(self):
+        """Move queued output into _pending_log_parts; the widget write happens in _apply_log."""
+        # Clear the flag before draining so a put racing with us schedules another pass
+        self._log_drain_pending = False
+        parts = self._pending_log_parts
+        done = False
         try:
             while True:
                 msg = self.log_queue.get_nowait()
                 if msg[0] == "done":
-                    self.running = False
-                    try:
-                        self.run_btn.configure(state="normal")
-                        self.remove_games_btn.configure(state="normal")
-                    except Exception:
-                        pass
+                    done = True
                     continue
-                kind, line = msg[0], msg[1]
-                self.log_text.configure(state="normal")
-                self.log_text.insert("end", line)
-                self.log_text.see("end")
-                self.log_text.configure(state="disabled")
-                if line.startswith("BANNER:"):
-                    banner_text = line[7:].strip()
-                    if banner_text:
-                        self.root.after(0, lambda t=banner_text: messagebox.showinfo("GameSphere Import Tool", t))
+                parts.append(msg[1])
         except queue.Empty:
             pass
-        self.root.after(200, self._poll_log)
+        if parts and not self._log_apply_pending:
+            # Separate idle pass so Tk can handle pending redraws between a burst's drains and its insert
+            self._log_apply_pending = True
+            self.root.after_idle(self._apply_log)
+        if done:
+            # Write the run's tail (and its BANNER line) now: a click on Run/Remove once the buttons
+            # are enabled would discard parts still waiting for the idle _apply_log pass
+            self._apply_log()
+            self.running = False
+            try:
+                self.run_btn.configure(state="normal")
+                self.remove_games_btn.configure(state="normal")
+            except Exception:
+                pass
+
+    def _apply_log(self):
+        """Write everything drained since the last pass with one insert, then show any banners."""
+        self._log_apply_pending = False
+        if not self._pending_log_parts:
+            return
+        # One insert per pass: Tk text commands are expensive per call
+        text = "".join(self._pending_log_parts)
+        self._pending_log_parts.clear()
+        self._append_log(text)
+        # Banners are rare; only split the batch into lines when it contains one.
+        # Queue items can hold several lines, so check lines, not items.
+        for line in (text.splitlines() if "BANNER:" in text else ()):
+            if line.startswith("BANNER:"):
+                banner_text = line[7:].strip()
+                if banner_text:
+                    from tkinter import messagebox
+                    self.root.after(0, lambda t=banner_text: messagebox.showinfo("GameSphere Import Tool", t))
 
     def run(self):
         self.root.mainloop()
@@ -663,6 +986,7 @@ def main():
         app = SunshineGUI()
         app.run()
     except Exception as e:
+        from tkinter import messagebox
         messagebox.showerror("GameSphere Import Tool — Error", f"The application failed to start:\n\n{e}")
         raise
 
@@ -1,57 +1,195 @@
 import os
 import json
 import xml.etree.ElementTree as ET
-import vdf
 import requests
-import glob
-from PIL import Image
 import io
 import subprocess
 import time
-import psutil
 import logging
+import logging.handlers
+import atexit
 import argparse
+import hashlib
+import re
+import stat
 import sys
-from functools import lru_cache
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 from dotenv import load_dotenv
 
+try:
+    import orjson  # optional: faster apps.json load/dump (pip install gamesphere-import-tool[fast])
+except ImportError:
+    orjson = None
+try:
+    # optional (Windows): create/read .lnk shortcuts in-process instead of via PowerShell
+    import pythoncom
+    from win32com.client import Dispatch as _com_dispatch
+except ImportError:
+    pythoncom = None
+from requests.adapters import HTTPAdapter, Retry  # Retry is urllib3's, re-exported by requests
+
+# Shared HTTP session: every Steam / SteamGridDB / CDN call reuses pooled keep-alive
+# connections instead of paying a new TCP + TLS handshake per request.
+# Connection errors, timeouts and 5xx answers are retried here with exponential backoff, so callers
+# make a single call. 429s are not retried here: they go back to _limited_get, whose per-host
+# limiter pauses and narrows that host's traffic.
+HTTP_POOL_SIZE = 20
+HTTP_USER_AGENT = 'GamesphereImportTool/0.2.0'
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(('GET', 'HEAD')),
+    raise_on_status=False,
+)
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+HTTP_SESSION.mount('https://', _http_adapter)
+HTTP_SESSION.mount('http://', _http_adapter)
+HTTP_SESSION.headers['User-Agent'] = HTTP_USER_AGENT
+
+
+class _HostLimiter:
+    """
+    Caps concurrent requests to one host and spaces their start times at least min_interval apart.
+    The cap adapts: a 429 halves it, and every 4 x cap successful calls in a row raise it by one,
+    up to max_concurrent.
+    """
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self._cond = threading.Condition()
+        self._max_concurrent = max_concurrent
+        self._limit = max_concurrent
+        self._active = 0
+        self._successes = 0
+        self._min_interval = min_interval
+        self._next_start = 0.0
+
+    def __enter__(self):
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._min_interval
+        if start > now:
+            time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Change the upper bound (STEAMGRIDDB_MAX_WORKERS); the current cap starts there."""
+        with self._cond:
+            self._max_concurrent = self._limit = max(1, max_concurrent)
+            self._successes = 0
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        """Count a call that was not throttled; enough of them in a row lift the cap by one."""
+        with self._cond:
+            if self._limit >= self._max_concurrent:
+                return
+            self._successes += 1
+            if self._successes >= 4 * self._limit:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify()
+
+    def back_off(self, seconds: float) -> None:
+        """Hold every new request to this host for `seconds` (after a 429) and halve the concurrency cap."""
+        with self._cond:
+            self._next_start = max(self._next_start, time.monotonic() + seconds)
+            self._limit = max(1, self._limit // 2)
+            self._successes = 0
+
+
+# Per-host limits (upper bounds for the adaptive cap): stay under Steam Store / SteamGridDB throttling
+# instead of retrying 429s.
+# Hosts not listed (the Steam CDN) are only bounded by the connection pool.
+_HOST_LIMITERS = {
+    'store.steampowered.com': _HostLimiter(max_concurrent=8, min_interval=0.25),
+    'www.steamgriddb.com': _HostLimiter(max_concurrent=4, min_interval=0.1),
+}
+_RETRY_AFTER_DEFAULT = 5.0
+_RETRY_AFTER_MAX = 60.0
+
+
+def _limited_get(url: str, **kwargs) -> requests.Response:
+    """HTTP_SESSION.get, throttled per host; a 429 makes all later calls to that host wait Retry-After."""
+    limiter = _HOST_LIMITERS.get(urlsplit(url).hostname)
+    if limiter is None:
+        return HTTP_SESSION.get(url, **kwargs)
+    with limiter:
+        response = HTTP_SESSION.get(url, **kwargs)
+    if response.status_code == 429:
+        try:
+            delay = float(response.headers.get('Retry-After', _RETRY_AFTER_DEFAULT))
+        except ValueError:
+            delay = _RETRY_AFTER_DEFAULT
+        delay = min(max(delay, 0.0), _RETRY_AFTER_MAX)
+        logging.warning("Rate limited by %s; pausing requests for %.0fs", urlsplit(url).hostname, delay)
+        limiter.back_off(delay)
+    elif response.status_code < 500:
+        limiter.record_success()
+    return response
+
+
 # Configuration and logging setup
+LOG_BUFFER_CAPACITY = 32  # records held before a log-file write; small, so a killed run still leaves its trail
+PROGRESS_LOG_INTERVAL = 2.0  # seconds between "Processed x/y" progress lines
+
+# Handlers installed by the first setup_logging call: (console, buffered file)
+_log_handlers: Optional[Tuple[logging.StreamHandler, logging.handlers.MemoryHandler]] = None
+
 def setup_logging(verbose: bool = False) -> None:
-    """Configure logging for the application."""
+    """Configure logging for the application. Later calls (GUI runs in-process) reuse the same handlers."""
+    global _log_handlers
     level = logging.DEBUG if verbose else logging.INFO
+    if _log_handlers is not None:
+        # Follow the stdout of this run and its verbosity; no new file handle or atexit entry
+        console_handler, _buffered = _log_handlers
+        console_handler.setStream(sys.stdout)
+        logging.getLogger().setLevel(level)
+        return
+    # Batch log-file writes in small groups; warnings, errors and exit flush immediately
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.FileHandler('sunshine_automation.log')
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+    )
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('sunshine_automation.log')
+            console_handler,
+            buffered_handler
         ]
     )
+    atexit.register(buffered_handler.flush)
+    _log_handlers = (console_handler, buffered_handler)
 
+@lru_cache(maxsize=256)
 def normalize_path(path: str) -> str:
     """Normalize path and handle escape sequences properly."""
     if not path:
         return path
     
-    # Handle raw string paths (common in Windows)
-    # Replace double backslashes with single backslashes
-    path = path.replace('\\\\', '\\')
-    
-    # Normalize the path
-    path = os.path.normpath(path)
-    
-    # Expand environment variables and user home
-    path = os.path.expandvars(path)
-    path = os.path.expanduser(path)
-    
-    return path
+    # Collapse doubled backslashes (raw Windows paths), normalize, then expand env vars and ~
+    return os.path.expanduser(os.path.expandvars(os.path.normpath(path.replace('\\\\', '\\'))))
 
 def validate_config() -> Dict[str, str]:
     """Load and validate configuration from environment variables."""
     load_dotenv()
+    normalize_path.cache_clear()  # expansions depend on the environment just loaded (GUI reruns in-process)
     
     required_vars = {
         'steam_library_vdf_path': 'Steam library VDF file path',
@@ -71,7 +209,7 @@ def validate_config() -> Dict[str, str]:
         else:
             if 'PATH' in var or 'FOLDER' in var:
                 value = normalize_path(value)
-                logging.debug(f"Normalized {var}: {value}")
+                logging.debug("Normalized %s: %s", var, value)
         config[var] = value or ''
         config[var.upper()] = value or ''
 
@@ -104,33 +242,53 @@ def validate_config() -> Dict[str, str]:
     config['STEAM_EXE_PATH'] = normalize_path(steam_exe) if steam_exe else ''
     config['SUNSHINE_EXE_PATH'] = normalize_path(sunshine_exe) if sunshine_exe else ''
     
+    # Collect every problem first so a misconfigured .env is reported in one go
+    errors = []
     if missing_vars:
-        logging.error(f"Missing required environment variables: {', '.join(missing_vars)}")
-        sys.exit(1)
+        errors.append(f"Missing required environment variables: {', '.join(missing_vars)}")
     
-    # Validate paths exist
-    if not os.path.exists(config['STEAM_LIBRARY_VDF_PATH']):
-        logging.error(f"Steam library VDF file not found: {config['STEAM_LIBRARY_VDF_PATH']}")
-        sys.exit(1)
-    
-    # Validate parent directories exist for output paths
+    # Validate paths exist (one stat per path)
     apps_dir = os.path.dirname(config['SUNSHINE_APPS_JSON_PATH'])
-    if not os.path.exists(apps_dir):
-        logging.error(f"Sunshine config directory not found: {apps_dir}")
-        logging.info(f"Please ensure Sunshine is installed and has created its config directory")
+    path_checks = (
+        (config['STEAM_LIBRARY_VDF_PATH'], "Steam library VDF file not found", None),
+        (apps_dir, "Sunshine config directory not found",
+         "Please ensure Sunshine is installed and has created its config directory"),
+    )
+    hints = []
+    for path, message, hint in path_checks:
+        if not path:
+            continue  # already reported as missing
+        try:
+            os.stat(path)
+        except OSError:
+            errors.append(f"{message}: {path}")
+            if hint:
+                hints.append(hint)
+    
+    if errors:
+        for error in errors:
+            logging.error(error)
+        for hint in hints:
+            logging.info(hint)
         sys.exit(1)
     
     return config
 
 
+def _iter_processes_named(image_name: str):
+    """Yield running processes whose name matches image_name (case-insensitive)."""
+    import psutil
+    for proc in psutil.process_iter(['name']):
+        if (proc.info.get('name') or '').lower() == image_name:
+            yield proc
+
+
 def _is_steam_running() -> bool:
     """Return True if steam.exe is already running (Windows)."""
     if os.name != 'nt':
         return False
     try:
-        for proc in psutil.process_iter(['name']):
-            if proc.info.get('name') and proc.info['name'].lower() == 'steam.exe':
-                return True
+        return next(_iter_processes_named('steam.exe'), None) is not None
     except Exception:
         pass
     return False
@@ -156,7 +314,26 @@ def ensure_steam_running(steam_exe_path: str) -> None:
         time.sleep(5)  # Brief pause for Steam to begin starting
         logging.info("Steam start requested")
     except Exception as e:
-        logging.error(f"Error starting Steam: {e}")
+        logging.error("Error starting Steam: %s", e)
+
+def _taskkill(image_name: str) -> Optional[bool]:
+    """
+    Force-terminate every process named image_name with one taskkill call (Windows).
+    Returns True if something was killed, False if nothing was running, None if taskkill failed.
+    """
+    try:
+        result = subprocess.run(['taskkill', '/F', '/IM', image_name], capture_output=True, timeout=30)
+    except Exception as e:
+        logging.debug("taskkill unavailable: %s", e)
+        return None
+    if result.returncode == 0:
+        logging.debug("Terminated %s via taskkill", image_name)
+        return True
+    if result.returncode == 128:  # no such process
+        return False
+    logging.debug("taskkill %s exited with %s", image_name, result.returncode)
+    return None
+
 
 def restart_sunshine(sunshine_exe_path: str) -> None:
     """Restart Sunshine/Apollo (or other Sunshine-compatible host) safely."""
@@ -170,152 +347,428 @@ def restart_sunshine(sunshine_exe_path: str) -> None:
     
     # Derive process name from exe path so both Sunshine and Apollo work
     process_name = os.path.basename(sunshine_exe_path).lower()
-    logging.info(f"Restarting host ({process_name})...")
+    logging.info("Restarting host (%s)...", process_name)
     try:
-        terminated = False
-        for proc in psutil.process_iter(['name', 'pid']):
-            if proc.info['name'] and proc.info['name'].lower() == process_name:
-                logging.debug(f"Terminating Sunshine process (PID: {proc.info['pid']})")
-                proc.terminate()
+        terminated = _taskkill(process_name)
+        if terminated is None:
+            # taskkill missing or refused: fall back to scanning the process list
+            import psutil
+            # Collect matches first, then signal them all and wait for them together
+            procs = list(_iter_processes_named(process_name))
+            for proc in procs:
+                logging.debug("Terminating Sunshine process (PID: %s)", proc.pid)
+                try:
+                    proc.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+            gone, alive = psutil.wait_procs(procs, timeout=30)
+            for proc in alive:
+                logging.warning("Sunshine process (PID: %s) didn't terminate gracefully", proc.pid)
                 try:
-                    proc.wait(timeout=30)
-                    terminated = True
-                except psutil.TimeoutExpired:
-                    logging.warning(f"Sunshine process (PID: {proc.info['pid']}) didn't terminate gracefully")
                     proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            terminated = bool(gone)
         
         if terminated:
             time.sleep(3)  # Brief pause before restart
         
-        logging.info(f"Starting host from: {sunshine_exe_path}")
+        logging.info("Starting host from: %s", sunshine_exe_path)
         subprocess.Popen([sunshine_exe_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         logging.info("Host restart completed")
         
     except Exception as e:
-        logging.error(f"Error restarting Sunshine: {e}")
+        logging.error("Error restarting Sunshine: %s", e)
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes with orjson when installed, else the stdlib (both raise json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON bytes for the tool's own cache files (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+# AppID -> name survives between runs; store names rarely change, so only new games and
+# entries older than NAME_CACHE_TTL cost an appdetails request. On disk: {app_id: {"name": ..., "ts": unix time}}.
+NAME_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.sunshine_automation_cache.json')
+NAME_CACHE_TTL = 30 * 24 * 3600
+_NAME_CACHE_SAVE_EVERY = 50
+_name_cache: Optional[Dict[str, str]] = None  # fresh entries only
+_name_cache_times: Dict[str, float] = {}
+_stale_names: Dict[str, str] = {}  # expired entries, used if the refresh fails
+_name_cache_unsaved = 0
+_name_cache_lock = threading.Lock()
+
+
+def _get_name_cache() -> Dict[str, str]:
+    """The AppID -> name cache (entries younger than NAME_CACHE_TTL), read from NAME_CACHE_PATH on first use."""
+    global _name_cache
+    with _name_cache_lock:
+        if _name_cache is None:
+            _name_cache = {}
+            try:
+                with open(NAME_CACHE_PATH, 'rb') as f:
+                    data = _json_loads(f.read())
+                if not isinstance(data, dict):
+                    data = {}
+                now = time.time()
+                for app_id, entry in data.items():
+                    if isinstance(entry, str):
+                        name, ts = entry, now  # pre-TTL cache file: start the clock today
+                    elif isinstance(entry, dict) and isinstance(entry.get('name'), str):
+                        name, ts = entry['name'], entry.get('ts') or 0
+                    else:
+                        continue
+                    if now - ts < NAME_CACHE_TTL:
+                        _name_cache[str(app_id)] = name
+                        _name_cache_times[str(app_id)] = ts
+                    else:
+                        _stale_names[str(app_id)] = name
+                logging.debug("Loaded %d cached game names (%d expired) from %s",
+                              len(_name_cache), len(_stale_names), NAME_CACHE_PATH)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.warning("Ignoring unreadable name cache %s: %s", NAME_CACHE_PATH, e)
+        return _name_cache
+
+
+def save_name_cache() -> None:
+    """Write the name cache to disk if it gained entries since the last save."""
+    global _name_cache_unsaved
+    with _name_cache_lock:
+        if not _name_cache_unsaved or _name_cache is None:
+            return
+        snapshot = {app_id: {'name': name, 'ts': _name_cache_times.get(app_id, 0)}
+                    for app_id, name in _name_cache.items()}
+        _name_cache_unsaved = 0
+    tmp_path = f"{NAME_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(snapshot))
+        os.replace(tmp_path, NAME_CACHE_PATH)
+    except OSError as e:
+        logging.warning("Could not save name cache to %s: %s", NAME_CACHE_PATH, e)
+
+
+def _remember_game_names(names: Dict[str, str]) -> None:
+    """Add resolved AppID -> name pairs to the name cache (saved with the next save_name_cache)."""
+    global _name_cache_unsaved
+    if not names:
+        return
+    cache = _get_name_cache()
+    now = time.time()
+    with _name_cache_lock:
+        cache.update(names)
+        _name_cache_times.update(dict.fromkeys(names, now))
+        _name_cache_unsaved += len(names)
+
+
+# Full AppID -> name list for all of Steam (~10 MB), kept on disk for a week. It replaces one
+# appdetails request per unknown game with a single request when many names are missing.
+STEAM_APP_LIST_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
+APP_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.sunshine_automation_applist.json')
+APP_INDEX_TTL = 7 * 24 * 3600  # apps released since then fall back to appdetails
+_APP_INDEX_MIN_MISSING = 5
+# Installed Steam entries that are not games; appdetails reports them as unsuccessful, the app list does not
+_NON_GAME_NAME_RE = re.compile(r'^(?:Proton\b|Steam Linux Runtime|Steamworks Common Redistributables)')
+
+
+def fetch_app_index() -> Dict[str, str]:
+    """AppID -> name for every Steam app: the disk copy if under APP_INDEX_TTL old, else GetAppList. {} on failure."""
+    try:
+        if time.time() - os.path.getmtime(APP_INDEX_PATH) < APP_INDEX_TTL:
+            with open(APP_INDEX_PATH, 'rb') as f:
+                index = _json_loads(f.read())
+            if isinstance(index, dict):
+                logging.debug("Using cached Steam app list (%s apps)", len(index))
+                return index
+    except (OSError, ValueError):
+        pass
+    try:
+        response = _limited_get(STEAM_APP_LIST_URL, timeout=30)
+        response.raise_for_status()
+        apps = _json_loads(response.content)['applist']['apps']
+        index = {str(app['appid']): app['name'] for app in apps if app.get('name')}
+    except Exception as e:
+        logging.warning("Could not fetch the Steam app list, looking names up per game: %s", e)
+        return {}
+    tmp_path = f"{APP_INDEX_PATH}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(index))
+        os.replace(tmp_path, APP_INDEX_PATH)
+    except OSError as e:
+        logging.debug("Could not cache the Steam app list: %s", e)
+    logging.info("Fetched Steam app list (%s apps)", len(index))
+    return index
+
 
-@lru_cache(maxsize=1000)
 def get_game_name(app_id: str) -> Optional[str]:
-    """Fetch game name from Steam API with caching and retry logic."""
-    url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
+    """Game name for app_id: from the persistent cache, else fetched from the Steam API."""
+    global _name_cache_unsaved
+    cache = _get_name_cache()
+    name = cache.get(app_id)
+    if name:
+        return name
+    name = _fetch_game_name(app_id)
+    if not name:
+        return _stale_names.get(app_id)  # expired, but better than nothing
+    with _name_cache_lock:
+        cache[app_id] = name
+        _name_cache_times[app_id] = time.time()
+        _name_cache_unsaved += 1
+        flush = _name_cache_unsaved >= _NAME_CACHE_SAVE_EVERY
+    if flush:
+        save_name_cache()
+    return name
+
+
+def _fetch_game_name(app_id: str) -> Optional[str]:
+    """Fetch game name from Steam API (HTTP_SESSION retries transient failures)."""
+    # filters=basic drops screenshots, DLC, descriptions etc.; 'name' is kept
+    url = f"https://store.steampowered.com/api/appdetails?appids={app_id}&filters=basic"
     
-    for attempt in range(3):
+    try:
+        response = _limited_get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        
+        if str(app_id) in data and data[str(app_id)].get('success'):
+            game_data = data[str(app_id)].get('data', {})
+            name = game_data.get('name')
+            if name:
+                logging.debug("Retrieved name for AppID %s: %s", app_id, name)
+                return name
+        
+        logging.warning("No valid data found for AppID %s", app_id)
+        return None
+        
+    except requests.exceptions.Timeout:
+        logging.error("Timeout fetching name for AppID %s", app_id)
+    except requests.exceptions.RequestException as e:
+        logging.error("Failed to fetch name for AppID %s: %s", app_id, e)
+    except Exception as e:
+        logging.error("Unexpected error fetching name for AppID %s: %s", app_id, e)
+    return None
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8\xff'
+_DOWNLOAD_CHUNK_SIZE = 65536
+_IMAGE_HEAD_SIZE = 12  # enough for the PNG, JPEG and RIFF/WEBP signatures
+VALIDATE_IMAGES = False  # --validate-images: fully verify each grid with PIL after download
+REFRESH_ART = False  # --refresh-art: download grids again even when one is already on disk
+
+
+def _image_kind(head: bytes) -> Optional[str]:
+    """Identify PNG/JPEG/WebP data from its leading bytes; None if unrecognised."""
+    if head.startswith(PNG_SIGNATURE):
+        return 'png'
+    if head.startswith(JPEG_SIGNATURE):
+        return 'jpeg'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def _is_image_content_type(headers) -> bool:
+    """False only when the response declares a non-image Content-Type (a missing header is given the benefit of the doubt)."""
+    content_type = headers.get('Content-Type', '').split(';')[0].strip().lower()
+    return not content_type or content_type.startswith('image/') or content_type == 'application/octet-stream'
+
+
+def _write_grid_image(response: requests.Response, grid_path: str, min_size: int = 0) -> None:
+    """
+    Save a streamed image response to grid_path as PNG (Sunshine only shows PNG box art).
+    The format is taken from the leading magic bytes: PNG is written to disk as it arrives,
+    JPEG/WebP is decoded and re-encoded once, anything else raises ValueError. Written via
+    a temp file, so a failed download never leaves a partial grid.
+    """
+    if not _is_image_content_type(response.headers):
+        raise ValueError(f"response is {response.headers.get('Content-Type')}, not an image")  # e.g. an HTML error page
+    chunks = response.iter_content(_DOWNLOAD_CHUNK_SIZE)
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= _IMAGE_HEAD_SIZE:
+            break
+    kind = _image_kind(head)
+    if kind is None:
+        raise ValueError("response is not a PNG, JPEG or WebP image")
+    if kind != 'png' or VALIDATE_IMAGES:
+        from PIL import Image  # only needed to convert JPEG/WebP or for --validate-images
+    os.makedirs(os.path.dirname(grid_path), exist_ok=True)
+    tmp_path = f"{grid_path}.tmp"
+    try:
+        if kind == 'png':
+            size = len(head)
+            with open(tmp_path, 'wb') as f:
+                f.write(head)
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            if size < min_size:
+                raise ValueError(f"image too small ({size} bytes)")
+        else:
+            data = head + b''.join(chunks)
+            if len(data) < min_size:
+                raise ValueError(f"image too small ({len(data)} bytes)")
+            Image.open(io.BytesIO(data)).save(tmp_path, "PNG")
+        if VALIDATE_IMAGES:
+            with Image.open(tmp_path) as image:
+                image.verify()
+        os.replace(tmp_path, grid_path)
+    except BaseException:
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if str(app_id) in data and data[str(app_id)].get('success'):
-                game_data = data[str(app_id)].get('data', {})
-                name = game_data.get('name')
-                if name:
-                    logging.debug(f"Retrieved name for AppID {app_id}: {name}")
-                    return name
-            
-            logging.warning(f"No valid data found for AppID {app_id}")
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+STEAMGRIDDB_GRIDS_URL = "https://www.steamgriddb.com/api/v2/grids/steam/{app_ids}"
+STEAMGRIDDB_BULK_SIZE = 20  # Steam IDs per multi-ID lookup (keeps the URL short)
+
+
+def _download_steamgriddb_grid(grid_url: str, app_id: str, grids_folder: str, file_id: Optional[str] = None) -> Optional[str]:
+    """Download a SteamGridDB grid image to {file_id or app_id}.png; return path or None."""
+    grid_path = os.path.join(grids_folder, f"{file_id or app_id}.png")
+    try:
+        with _limited_get(grid_url, timeout=30, stream=True) as grid_response:
+            grid_response.raise_for_status()
+            try:
+                _write_grid_image(grid_response, grid_path)
+            except requests.exceptions.RequestException:
+                raise  # dropped mid-download: a request error, not bad image data
+            except Exception as img_error:
+                logging.warning("Invalid image data for AppID %s: %s", app_id, img_error)
+                return None
+        logging.debug("Downloaded grid for AppID %s: %s", app_id, grid_path)
+        return grid_path
+    except requests.exceptions.Timeout:
+        logging.error("Timeout fetching grid for AppID %s", app_id)
+    except requests.exceptions.RequestException as e:
+        logging.error("Failed to fetch grid for AppID %s: %s", app_id, e)
+    except Exception as e:
+        logging.error("Unexpected error fetching grid for AppID %s: %s", app_id, e)
+    return None
+
+
+def fetch_grid_from_steamgriddb(app_id: str, api_key: str, grids_folder: str, file_id: Optional[str] = None) -> Optional[str]:
+    """Fetch game grid image from SteamGridDB (HTTP_SESSION retries transient failures); saved as {file_id or app_id}.png."""
+    url = STEAMGRIDDB_GRIDS_URL.format(app_ids=app_id)
+    headers = {"Authorization": f"Bearer {api_key}"}
+    
+    try:
+        response = _limited_get(url, headers=headers, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+        
+        if "data" in data and len(data["data"]) > 0:
+            return _download_steamgriddb_grid(data["data"][0]["url"], app_id, grids_folder, file_id)
+        else:
+            logging.warning("No grid data found for AppID %s", app_id)
             return None
             
-        except requests.exceptions.Timeout:
-            logging.warning(f"Timeout fetching name for AppID {app_id} (attempt {attempt + 1}/3)")
-        except requests.exceptions.RequestException as e:
-            logging.warning(f"Request error for AppID {app_id} (attempt {attempt + 1}/3): {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error fetching name for AppID {app_id}: {e}")
-            return None
-        
-        if attempt < 2:  # Don't sleep on last attempt
-            time.sleep(2 ** attempt)  # Exponential backoff
-    
-    logging.error(f"Failed to fetch name for AppID {app_id} after 3 attempts")
+    except requests.exceptions.Timeout:
+        logging.error("Timeout fetching grid for AppID %s", app_id)
+    except requests.exceptions.RequestException as e:
+        logging.error("Failed to fetch grid for AppID %s: %s", app_id, e)
+    except Exception as e:
+        logging.error("Unexpected error fetching grid for AppID %s: %s", app_id, e)
     return None
 
-def fetch_grid_from_steamgriddb(app_id: str, api_key: str, grids_folder: str) -> Optional[str]:
-    """Fetch game grid image from SteamGridDB with retry logic."""
-    url = f"https://www.steamgriddb.com/api/v2/grids/steam/{app_id}"
+
+def fetch_steamgriddb_grid_urls(app_ids: List[str], api_key: str) -> Dict[str, Optional[str]]:
+    """
+    Look up SteamGridDB grid URLs for many Steam app IDs with the multi-ID grids endpoint,
+    STEAMGRIDDB_BULK_SIZE IDs per request. Maps app_id -> first grid URL, or None when
+    SteamGridDB has no grid; IDs whose lookup failed are left out so callers can retry them.
+    """
     headers = {"Authorization": f"Bearer {api_key}"}
-    
-    for attempt in range(3):
+    urls: Dict[str, Optional[str]] = {}
+    for start in range(0, len(app_ids), STEAMGRIDDB_BULK_SIZE):
+        chunk = app_ids[start:start + STEAMGRIDDB_BULK_SIZE]
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _limited_get(STEAMGRIDDB_GRIDS_URL.format(app_ids=','.join(chunk)), headers=headers, timeout=15)
             response.raise_for_status()
-            data = response.json()
-            
-            if "data" in data and len(data["data"]) > 0:
-                grid_url = data["data"][0]["url"]
-                grid_response = requests.get(grid_url, timeout=30)
-                grid_response.raise_for_status()
-                
-                # Validate image data
-                try:
-                    image = Image.open(io.BytesIO(grid_response.content))
-                    image.verify()  # Verify it's a valid image
-                    
-                    # Reopen for saving (verify() closes the image)
-                    image = Image.open(io.BytesIO(grid_response.content))
-                    grid_path = os.path.join(grids_folder, f"{app_id}.png")
-                    
-                    # Ensure directory exists
-                    os.makedirs(grids_folder, exist_ok=True)
-                    
-                    image.save(grid_path, "PNG")
-                    logging.debug(f"Downloaded grid for AppID {app_id}: {grid_path}")
-                    return grid_path
-                    
-                except Exception as img_error:
-                    logging.warning(f"Invalid image data for AppID {app_id}: {img_error}")
-                    return None
-            else:
-                logging.warning(f"No grid data found for AppID {app_id}")
-                return None
-                
-        except requests.exceptions.Timeout:
-            logging.warning(f"Timeout fetching grid for AppID {app_id} (attempt {attempt + 1}/3)")
-        except requests.exceptions.RequestException as e:
-            logging.warning(f"Request error for AppID {app_id} (attempt {attempt + 1}/3): {e}")
+            data = response.json().get("data") or []
         except Exception as e:
-            logging.error(f"Unexpected error fetching grid for AppID {app_id}: {e}")
-            return None
-        
-        if attempt < 2:  # Don't sleep on last attempt
-            time.sleep(2 ** attempt)  # Exponential backoff
-    
-    logging.error(f"Failed to fetch grid for AppID {app_id} after 3 attempts")
-    return None
+            logging.warning("SteamGridDB bulk lookup failed for %s app(s): %s", len(chunk), e)
+            continue
+        if len(chunk) == 1:
+            # A single ID gets the plain response: data is that game's grid list
+            data = [{"success": True, "data": data}]
+        # Multiple IDs: data holds one {success, data} result per requested ID, in request order
+        for app_id, result in zip(chunk, data):
+            grids = result.get("data") if isinstance(result, dict) and result.get("success") else None
+            urls[app_id] = grids[0].get("url") if grids else None
+    return urls
 
 
 # Steam CDN URLs (no API key, no signup) — box art (library cover) first, then header fallback
 STEAM_CDN_LIBRARY_URL = "https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900_2x.jpg"  # box art 1200x1800
 STEAM_CDN_LIBRARY_FALLBACK_URL = "https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900.jpg"  # 600x900
 STEAM_CDN_HEADER_URL = "https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"  # wide tile fallback
+_CDN_MIN_IMAGE_SIZE = 500
 
 
-def _download_steam_cdn_image(url: str, app_id: str, grids_folder: str) -> Optional[str]:
-    """Download image from URL to grids_folder; return path or None."""
+def _download_steam_cdn_image(url: str, app_id: str, grids_folder: str, file_id: Optional[str] = None) -> Optional[str]:
+    """Download image from URL to grids_folder as {file_id or app_id}.png; return path or None."""
+    grid_path = os.path.join(grids_folder, f"{file_id or app_id}.png")
     try:
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        if len(response.content) < 500:
-            return None
-        image = Image.open(io.BytesIO(response.content))
-        image.verify()
-        image = Image.open(io.BytesIO(response.content))
-        grid_path = os.path.join(grids_folder, f"{app_id}.png")
-        os.makedirs(grids_folder, exist_ok=True)
-        image.save(grid_path, "PNG")
-        logging.debug(f"Downloaded image from Steam CDN for AppID {app_id}: {grid_path}")
+        with _limited_get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            # Tiny bodies are CDN placeholders: reject on the header before reading the body
+            length = response.headers.get('Content-Length', '')
+            if length.isdigit() and int(length) < _CDN_MIN_IMAGE_SIZE:
+                return None
+            _write_grid_image(response, grid_path, min_size=_CDN_MIN_IMAGE_SIZE)
+        logging.debug("Downloaded image from Steam CDN for AppID %s: %s", app_id, grid_path)
         return grid_path
     except Exception:
         return None
 
 
-def fetch_grid_from_steam_cdn(app_id: str, grids_folder: str) -> Optional[str]:
-    """Fetch box-art (library cover) image from Steam's public CDN. No API key or signup required."""
-    for url_template in (STEAM_CDN_LIBRARY_URL, STEAM_CDN_LIBRARY_FALLBACK_URL, STEAM_CDN_HEADER_URL):
-        url = url_template.format(app_id=app_id)
-        path = _download_steam_cdn_image(url, app_id, grids_folder)
-        if path:
-            return path
-    logging.warning(f"No Steam CDN image found for AppID {app_id}")
+def _cdn_has_image(url: str) -> bool:
+    """HEAD probe: True if url serves something bigger than a CDN placeholder (or of unknown size)."""
+    try:
+        response = HTTP_SESSION.head(url, timeout=5, allow_redirects=True)
+        if response.status_code != 200 or not _is_image_content_type(response.headers):
+            return False
+        length = response.headers.get('Content-Length', '')
+        return not length.isdigit() or int(length) >= _CDN_MIN_IMAGE_SIZE
+    except Exception:
+        return False
+
+
+def fetch_grid_from_steam_cdn(app_id: str, grids_folder: str, file_id: Optional[str] = None) -> Optional[str]:
+    """
+    Fetch box-art (library cover) image from Steam's public CDN. No API key or signup required.
+    Saved as {file_id or app_id}.png.
+    """
+    urls = [t.format(app_id=app_id) for t in (STEAM_CDN_LIBRARY_URL, STEAM_CDN_LIBRARY_FALLBACK_URL, STEAM_CDN_HEADER_URL)]
+    # Box art is fetched straight away, so the common case costs no extra request. Only when it is
+    # missing are the fallbacks HEAD-probed together, then just the first one that exists is downloaded
+    path = _download_steam_cdn_image(urls[0], app_id, grids_folder, file_id)
+    if path:
+        return path
+    fallbacks = urls[1:]
+    with ThreadPoolExecutor(max_workers=len(fallbacks)) as executor:
+        available = list(executor.map(_cdn_has_image, fallbacks))
+    for url, ok in zip(fallbacks, available):
+        if ok:
+            path = _download_steam_cdn_image(url, app_id, grids_folder, file_id)
+            if path:
+                return path
+    logging.warning("No Steam CDN image found for AppID %s", app_id)
     return None
 
 
@@ -325,7 +778,7 @@ def fetch_grid(app_id: str, api_key: str, grids_folder: str) -> Optional[str]:
         path = fetch_grid_from_steamgriddb(app_id, api_key.strip(), grids_folder)
         if path:
             return path
-        logging.debug(f"SteamGridDB failed for {app_id}, trying Steam CDN")
+        logging.debug("SteamGridDB failed for %s, trying Steam CDN", app_id)
     return fetch_grid_from_steam_cdn(app_id, grids_folder)
 
 
@@ -336,7 +789,7 @@ def _steamgriddb_search_steam_id(game_name: str, api_key: str) -> Optional[str]:
     url = f"https://www.steamgriddb.com/api/v2/search/autocomplete/{requests.utils.quote(game_name)}"
     headers = {"Authorization": f"Bearer {api_key.strip()}"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _limited_get(url, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         if data.get("success") and data.get("data"):
@@ -346,46 +799,65 @@ def _steamgriddb_search_steam_id(game_name: str, api_key: str) -> Optional[str]:
             if steam_id is not None:
                 return str(steam_id)
     except Exception as e:
-        logging.debug(f"SteamGridDB search for '{game_name}': {e}")
+        logging.debug("SteamGridDB search for '%s': %s", game_name, e)
     return None
 
 
 def fetch_grid_by_name(game_name: str, api_key: str, grids_folder: str, file_safe_id: str) -> Optional[str]:
     """Fetch grid for a non-Steam game by name (SteamGridDB search then Steam grid). Returns path or None."""
+    if not REFRESH_ART:
+        existing = os.path.join(grids_folder, f"{file_safe_id}.png")
+        try:
+            if os.path.getsize(existing) > 0:
+                return existing  # left by an earlier run
+        except OSError:
+            pass
     steam_id = _steamgriddb_search_steam_id(game_name, api_key)
     if steam_id:
-        path = fetch_grid_from_steamgriddb(steam_id, api_key.strip(), grids_folder)
-        if path:
-            # Save under file_safe_id so we don't overwrite Steam grids
-            dest = os.path.join(grids_folder, f"{file_safe_id}.png")
-            if dest != path and os.path.exists(path):
-                try:
-                    import shutil
-                    shutil.move(path, dest)
-                    return dest
-                except Exception:
-                    return path
-            return path
-        path = fetch_grid_from_steam_cdn(steam_id, grids_folder)
-        if path:
-            dest = os.path.join(grids_folder, f"{file_safe_id}.png")
-            if dest != path and os.path.exists(path):
-                try:
-                    import shutil
-                    shutil.move(path, dest)
-                    return dest
-                except Exception:
-                    return path
-            return path
+        # Written straight to {file_safe_id}.png: never touches a Steam game's {steam_id}.png, and two
+        # concurrent jobs that resolve to the same steam_id each get their own file
+        return (fetch_grid_from_steamgriddb(steam_id, api_key.strip(), grids_folder, file_safe_id)
+                or fetch_grid_from_steam_cdn(steam_id, grids_folder, file_safe_id))
     return None
 
 
+def _stable_id(prefix: str, key: str) -> str:
+    """File-safe id for a grid/shortcut name; unlike hash() it is the same in every run, so files are reused."""
+    return prefix + hashlib.blake2b(key.encode('utf-8'), digest_size=6).hexdigest()
+
+
+def fetch_grids_by_name(jobs: Dict[str, Tuple[str, str]], api_key: str, grids_folder: str) -> Dict[str, Optional[str]]:
+    """fetch_grid_by_name for many games concurrently: {key: (game_name, file_safe_id)} -> {key: path or None}."""
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(HTTP_POOL_SIZE, len(jobs))) as executor:
+        futures = {
+            key: executor.submit(fetch_grid_by_name, name, api_key or '', grids_folder, safe_id)
+            for key, (name, safe_id) in jobs.items()
+        }
+    grids = {}
+    for key, future in futures.items():
+        try:
+            grids[key] = future.result()
+        except Exception as e:
+            logging.error("Error fetching grid for %s: %s", jobs[key][0], e)
+            grids[key] = None
+    return grids
+
+
+def _dump_config(config: Dict) -> bytes:
+    """Serialize apps.json: orjson (2-space indent) when installed, else stdlib json with 4-space indent."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=4, ensure_ascii=False).encode('utf-8')
+
+
 def get_sunshine_config(path: str) -> Dict:
     """Load Sunshine configuration with error handling."""
     try:
         if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as file:
-                config = json.load(file)
+            with open(path, 'rb') as file:
+                config = _json_loads(file.read())
             
             # Validate config structure
             if not isinstance(config, dict):
@@ -397,7 +869,7 @@ def get_sunshine_config(path: str) -> Dict:
             if 'env' not in config:
                 config['env'] = ""
             
-            logging.info(f"Loaded Sunshine config with {len(config['apps'])} apps")
+            logging.info("Loaded Sunshine config with %s apps", len(config['apps']))
             return config
         else:
             config = {"env": "", "apps": []}
@@ -405,24 +877,35 @@ def get_sunshine_config(path: str) -> Dict:
             return config
             
     except json.JSONDecodeError as e:
-        logging.error(f"Invalid JSON in Sunshine config file: {e}")
+        logging.error("Invalid JSON in Sunshine config file: %s", e)
         raise
     except Exception as e:
-        logging.error(f"Error loading Sunshine config: {e}")
+        logging.error("Error loading Sunshine config: %s", e)
         raise
 
 def save_sunshine_config(path: str, config: Dict) -> None:
-    """Save Sunshine configuration with backup and error handling."""
+    """Save Sunshine configuration with backup and error handling. Skips the write when nothing changed."""
     import shutil
     backup_path = f"{path}.backup"
     config_dir = os.path.dirname(path)
 
     try:
-        # Create backup if file exists (use fallback dir if Program Files is read-only)
-        if os.path.exists(path):
+        # Compare parsed content, so indent / line endings written by the host or an older run
+        # still count as unchanged; no change means no backup and no write
+        try:
+            with open(path, 'rb') as file:
+                if _json_loads(file.read()) == config:
+                    logging.info("Sunshine config unchanged, not rewriting")
+                    return
+        except (OSError, ValueError):
+            pass
+        new_data = _dump_config(config)
+
+        # Create backup if file exists (use fallback dir if Program Files is read-only); GS_BACKUP=0 skips it
+        if os.getenv('GS_BACKUP', '1').strip() != '0' and os.path.exists(path):
             try:
                 shutil.copy2(path, backup_path)
-                logging.debug(f"Created backup: {backup_path}")
+                logging.debug("Created backup: %s", backup_path)
             except OSError as e:
                 if e.errno == 13:  # Permission denied
                     fallback = os.path.join(os.path.expanduser("~"), "GamesphereImportTool_backups")
@@ -430,7 +913,7 @@ def save_sunshine_config(path: str, config: Dict) -> None:
                     backup_name = os.path.basename(path) + ".backup"
                     backup_path = os.path.join(fallback, backup_name)
                     shutil.copy2(path, backup_path)
-                    logging.info(f"Backup saved to user folder (no write access to config dir): {backup_path}")
+                    logging.info("Backup saved to user folder (no write access to config dir): %s", backup_path)
                 else:
                     raise
 
@@ -445,11 +928,17 @@ def save_sunshine_config(path: str, config: Dict) -> None:
                 ) from e
             raise
 
-        # Write config
+        # Write config to a sibling temp file, then swap it in so the host never reads a torn file
+        tmp_path = f"{path}.tmp"
         try:
-            with open(path, 'w', encoding='utf-8') as file:
-                json.dump(config, file, indent=4, ensure_ascii=False)
+            with open(tmp_path, 'wb') as file:
+                file.write(new_data)
+            os.replace(tmp_path, path)
         except OSError as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             if e.errno == 13:
                 raise PermissionError(
                     "Cannot write to the config directory (e.g. Program Files). "
@@ -457,15 +946,32 @@ def save_sunshine_config(path: str, config: Dict) -> None:
                 ) from e
             raise
 
-        logging.info(f"Saved Sunshine config with {len(config.get('apps', []))} apps")
+        logging.info("Saved Sunshine config with %s apps", len(config.get('apps', [])))
 
     except PermissionError:
         raise
     except Exception as e:
-        logging.error(f"Error saving Sunshine config: {e}")
+        logging.error("Error saving Sunshine config: %s", e)
         raise
 
 
+_com_thread_state = threading.local()
+
+
+def _wscript_shell():
+    """WScript.Shell COM object via pywin32 (COM initialised once per thread), or None if unavailable."""
+    if pythoncom is None or os.name != 'nt':
+        return None
+    try:
+        if not getattr(_com_thread_state, 'initialized', False):
+            pythoncom.CoInitialize()
+            _com_thread_state.initialized = True
+        return _com_dispatch('WScript.Shell')
+    except Exception as e:
+        logging.debug("WScript.Shell unavailable, using PowerShell: %s", e)
+        return None
+
+
 def _create_shortcut_win(shortcut_path: str, target: str, work_dir: Optional[str] = None) -> bool:
     """Create a Windows .lnk shortcut. target can be an exe path or a protocol URL. Returns True on success."""
     if os.name != 'nt':
@@ -477,6 +983,15 @@ def _create_shortcut_win(shortcut_path: str, target: str, work_dir: Optional[str
         if not work_dir and target and os.path.sep in target and not target.startswith('com.'):
             work_dir = os.path.dirname(target)
         work_dir = work_dir or ''
+        shell = _wscript_shell()
+        if shell is not None:
+            link = shell.CreateShortcut(shortcut_path)
+            link.TargetPath = target
+            if work_dir:
+                link.WorkingDirectory = work_dir
+            link.Save()
+            logging.debug("Created shortcut: %s", shortcut_path)
+            return True
         env = os.environ.copy()
         env['SHORTCUT_PATH'] = shortcut_path
         env['TARGET_PATH'] = target
@@ -492,18 +1007,101 @@ def _create_shortcut_win(shortcut_path: str, target: str, work_dir: Optional[str
             ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', script],
             env=env, capture_output=True, timeout=10, check=True
         )
-        logging.debug(f"Created shortcut: {shortcut_path}")
+        logging.debug("Created shortcut: %s", shortcut_path)
         return True
     except Exception as e:
-        logging.warning(f"Failed to create shortcut {shortcut_path}: {e}")
+        logging.warning("Failed to create shortcut %s: %s", shortcut_path, e)
         return False
 
 
+_BULK_SHORTCUT_SCRIPT = (
+    '$s = New-Object -ComObject WScript.Shell; '
+    '$specs = @(Get-Content -Raw -Encoding UTF8 $env:SHORTCUT_SPECS | ConvertFrom-Json); '
+    'for ($i = 0; $i -lt $specs.Count; $i++) { try { '
+    '$l = $s.CreateShortcut($specs[$i].path); $l.TargetPath = $specs[$i].target; '
+    'if ($specs[$i].workdir) { $l.WorkingDirectory = $specs[$i].workdir }; '
+    '$l.Save(); Write-Output $i } catch { } }; '
+    '[System.Runtime.Interopservices.Marshal]::ReleaseComObject($s) | Out-Null'
+)
+
+
+_SHORTCUT_WORKERS = 8
+
+
+def _create_shortcuts_win(specs: List[Tuple[str, str, Optional[str]]]) -> Set[str]:
+    """
+    Create several .lnk shortcuts from (shortcut_path, target, work_dir) specs; returns the
+    shortcut_paths that were created. With pywin32 they are saved on a few COM threads;
+    without it the whole batch shares one PowerShell process.
+    """
+    if os.name != 'nt' or not specs:
+        return set()
+    if len(specs) == 1:
+        path, target, work_dir = specs[0]
+        return {path} if _create_shortcut_win(path, target, work_dir) else set()
+    if pythoncom is not None:
+        # In-process COM; each worker thread initialises COM once (see _wscript_shell)
+        with ThreadPoolExecutor(max_workers=min(_SHORTCUT_WORKERS, len(specs))) as executor:
+            results = list(executor.map(lambda spec: _create_shortcut_win(*spec), specs))
+        return {spec[0] for spec, ok in zip(specs, results) if ok}
+    payload = []
+    for shortcut_path, target, work_dir in specs:
+        path = os.path.normpath(shortcut_path)
+        if not path.lower().endswith('.lnk'):
+            path += '.lnk'
+        if not work_dir and target and os.path.sep in target and not target.startswith('com.'):
+            work_dir = os.path.dirname(target)
+        payload.append({'path': path, 'target': target, 'workdir': work_dir or ''})
+    import tempfile
+    fd, specs_path = tempfile.mkstemp(suffix='.json', prefix='gamesphere_shortcuts_')
+    created_idx: Set[int] = set()
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        env = os.environ.copy()
+        env['SHORTCUT_SPECS'] = specs_path
+        out = subprocess.run(
+            ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', _BULK_SHORTCUT_SCRIPT],
+            env=env, capture_output=True, text=True, timeout=10 + len(specs),
+        )
+        created_idx = {int(line) for line in out.stdout.split() if line.isdigit()}
+    except Exception as e:
+        logging.warning("Failed to create shortcuts: %s", e)
+    finally:
+        try:
+            os.remove(specs_path)
+        except OSError:
+            pass
+    created = set()
+    for i, (shortcut_path, _target, _work_dir) in enumerate(specs):
+        if i in created_idx:
+            created.add(shortcut_path)
+            logging.debug("Created shortcut: %s", payload[i]['path'])
+        else:
+            logging.warning("Failed to create shortcut %s", payload[i]['path'])
+    return created
+
+
 def _read_shortcut_target_win(shortcut_path: str) -> Optional[str]:
     """Read the target path/URL of a Windows .lnk file. Returns None on failure."""
-    if os.name != 'nt' or not os.path.isfile(shortcut_path):
+    if os.name != 'nt':
+        return None
+    try:
+        st = os.stat(shortcut_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
+    return _read_shortcut_target_cached(shortcut_path, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _read_shortcut_target_cached(shortcut_path: str, mtime_ns: int) -> Optional[str]:
+    """COM/PowerShell read behind _read_shortcut_target_win; keyed on mtime so an edited .lnk is read again."""
     try:
+        shell = _wscript_shell()
+        if shell is not None:
+            return shell.CreateShortcut(shortcut_path).TargetPath or None
         env = os.environ.copy()
         env['LNK_PATH'] = shortcut_path
         out = subprocess.run(
@@ -524,109 +1122,209 @@ def _shortcut_launch_cmd(shortcut_path: str) -> str:
     return f'cmd /c start "" "{path_norm}"'
 
 
+# cmd /c start "" "C:\path\to\file.lnk" (see _shortcut_launch_cmd)
+_SHORTCUT_CMD_RE = re.compile(r'start\s+""\s+"([^"]+\.lnk)"', re.IGNORECASE)
+
+
 def _extract_shortcut_path_from_cmd(cmd: str) -> Optional[str]:
     """If cmd is or contains a path to a .lnk file, return that path (normalized). Otherwise None."""
     c = (cmd or '').strip()
-    # cmd /c start "" "C:\path\to\file.lnk"
-    if 'start "" "' in c and '.lnk' in c:
-        try:
-            i = c.index('start "" "') + len('start "" "')  # opening " of path
-            j = c.index('"', i + 1)
-            path = c[i + 1:j]
-            if path.lower().endswith('.lnk'):
-                return os.path.normpath(path)
-        except ValueError:
-            pass
+    match = _SHORTCUT_CMD_RE.search(c)
+    if match:
+        return os.path.normpath(match.group(1))
     if c.lower().endswith('.lnk') and os.path.sep in c:
         return os.path.normpath(c)
     return None
 
 
-def load_installed_games(library_vdf_path: str) -> Dict[str, str]:
-    """Load installed games from Steam library VDF file."""
-    logging.info(f"Loading Steam library from {library_vdf_path}")
+# libraryfolders.vdf: each library folder has a "path" and an "apps" { "<appid>" "<size>" ... } block
+_VDF_APPS_BLOCK_RE = re.compile(r'"apps"\s*\{([^}]*)\}')
+_VDF_APP_ID_RE = re.compile(r'"(\d+)"\s*"\d+"')
+_VDF_PATH_RE = re.compile(r'"path"\s*"((?:[^"\\]|\\.)*)"')
+_VDF_ESCAPE_RE = re.compile(r'\\(.)')
+# appmanifest_<appid>.acf: the installed app's store name, readable offline
+_ACF_NAME_RE = re.compile(r'^\s*"name"\s*"((?:[^"\\]|\\.)*)"', re.M)
+
+
+def _read_library_app_ids(library_vdf_path: str, strict_parse: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    Installed AppIDs from libraryfolders.vdf, in file order without duplicates, and the library folder paths.
+    Scans the "apps" blocks with a regex; strict_parse (or a file with no such block) uses vdf.load.
+    """
+    with open(library_vdf_path, 'r', encoding='utf-8') as file:
+        text = file.read()
+    if not strict_parse:
+        blocks = _VDF_APPS_BLOCK_RE.findall(text)
+        if blocks:
+            app_ids = list(dict.fromkeys(app_id for block in blocks for app_id in _VDF_APP_ID_RE.findall(block)))
+            return app_ids, [_VDF_ESCAPE_RE.sub(r'\1', p) for p in _VDF_PATH_RE.findall(text)]
+        logging.debug("No apps blocks found by the fast VDF scan, falling back to full parse")
+    import vdf  # the full parser is only needed for --strict-parse or unusual files
+    folders = [f for f in vdf.loads(text).get('libraryfolders', {}).values() if isinstance(f, dict)]
+    app_ids = list(dict.fromkeys(app_id for folder_data in folders for app_id in folder_data.get("apps", {})))
+    return app_ids, [folder_data['path'] for folder_data in folders if folder_data.get('path')]
+
+
+def _read_manifest_names(app_ids: List[str], library_paths: List[str]) -> Dict[str, str]:
+    """AppID -> name from the appmanifest_<appid>.acf files in each library's steamapps folder (no network)."""
+    wanted = {f"appmanifest_{app_id}.acf": app_id for app_id in app_ids}
+    names: Dict[str, str] = {}
+    for library in library_paths:
+        try:
+            with os.scandir(os.path.join(library, 'steamapps')) as entries:
+                manifests = [(wanted[e.name], e.path) for e in entries if e.name in wanted]
+        except OSError:
+            continue
+        for app_id, path in manifests:
+            if app_id in names:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    match = _ACF_NAME_RE.search(f.read())
+            except OSError:
+                continue
+            if match:
+                names[app_id] = _VDF_ESCAPE_RE.sub(r'\1', match.group(1))
+    return names
+
+
+def load_installed_games(
+    library_vdf_path: str,
+    strict_parse: bool = False,
+    known_names: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """
+    Load installed games from Steam library VDF file.
+    known_names (AppID -> name, e.g. games already in apps.json) are used as-is, without a lookup.
+    """
+    logging.info("Loading Steam library from %s", library_vdf_path)
     
     try:
-        with open(library_vdf_path, 'r', encoding='utf-8') as file:
-            steam_data = vdf.load(file)
+        app_ids, library_paths = _read_library_app_ids(library_vdf_path, strict_parse)
     except Exception as e:
-        logging.error(f"Error loading Steam library VDF: {e}")
+        logging.error("Error loading Steam library VDF: %s", e)
         raise
     
     logging.debug("Raw Steam library data loaded successfully")
     
     installed_games = {}
-    total_apps = 0
+    logging.info("Processing %s Steam apps...", len(app_ids))
     
-    # Count total apps for progress tracking
-    for folder_data in steam_data.get('libraryfolders', {}).values():
-        if "apps" in folder_data:
-            total_apps += len(folder_data["apps"])
+    cache = _get_name_cache()
+    known_names = known_names or {}
+    missing = [app_id for app_id in app_ids if app_id not in cache and app_id not in known_names]
+    # Installed games carry their name in the local app manifest
+    if missing:
+        manifest_names = _read_manifest_names(missing, library_paths)
+        if manifest_names:
+            tools = {app_id for app_id, name in manifest_names.items() if _NON_GAME_NAME_RE.match(name)}
+            for app_id in tools:
+                logging.debug("Skipping Steam tool: %s (ID: %s)", manifest_names.pop(app_id), app_id)
+            _remember_game_names(manifest_names)
+            logging.info("Read %s names from Steam app manifests", len(manifest_names))
+            missing = [app_id for app_id in missing if app_id not in manifest_names and app_id not in tools]
+    # Many unknown IDs (first run, big library): resolve them from the full app list in one request
+    if len(missing) >= _APP_INDEX_MIN_MISSING:
+        app_index = fetch_app_index()
+        if app_index:
+            resolved = {}
+            unresolved = []
+            for app_id in missing:
+                name = app_index.get(app_id)
+                if name is None:
+                    unresolved.append(app_id)
+                elif not _NON_GAME_NAME_RE.match(name):
+                    resolved[app_id] = name
+                else:
+                    # Proton / runtimes / redistributables: appdetails rejects these too
+                    logging.debug("Skipping Steam tool: %s (ID: %s)", name, app_id)
+            _remember_game_names(resolved)
+            logging.info("Resolved %s names from the Steam app list, %s left to look up", len(resolved), len(unresolved))
+            missing = unresolved
     
-    logging.info(f"Processing {total_apps} Steam apps...")
+    for app_id in app_ids:
+        name = cache.get(app_id) or known_names.get(app_id)
+        if name:
+            installed_games[app_id] = name
     
-    # Use thread pool for concurrent API calls
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_app_id = {}
-        
-        for folder_data in steam_data.get('libraryfolders', {}).values():
-            if "apps" in folder_data:
-                for app_id in folder_data["apps"].keys():
-                    future = executor.submit(get_game_name, app_id)
-                    future_to_app_id[future] = app_id
-        
-        processed = 0
-        for future in as_completed(future_to_app_id):
-            app_id = future_to_app_id[future]
-            processed += 1
+    total_apps = len(missing)
+    # Fully cached runs (the usual case) never start the pool
+    if missing:
+        # Use thread pool for concurrent API calls (one worker per pooled connection)
+        with ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE) as executor:
+            future_to_app_id = {executor.submit(get_game_name, app_id): app_id for app_id in missing}
             
-            try:
-                game_name = future.result()
-                if game_name:
-                    installed_games[app_id] = game_name
-                    logging.debug(f"Found game: {game_name} (ID: {app_id})")
-            except Exception as e:
-                logging.warning(f"Error processing AppID {app_id}: {e}")
+            processed = 0
+            last_progress = time.monotonic()
+            for future in as_completed(future_to_app_id):
+                app_id = future_to_app_id[future]
+                processed += 1
             
-            if processed % 50 == 0 or processed == total_apps:
-                logging.info(f"Processed {processed}/{total_apps} apps...")
+                try:
+                    game_name = future.result()
+                    if game_name:
+                        installed_games[app_id] = game_name
+                        logging.debug("Found game: %s (ID: %s)", game_name, app_id)
+                except Exception as e:
+                    logging.warning("Error processing AppID %s: %s", app_id, e)
+            
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_LOG_INTERVAL or processed == total_apps:
+                    logging.info("Processed %d/%d apps...", processed, total_apps)
+                    last_progress = now
     
-    logging.info(f"Found {len(installed_games)} installed games")
+    save_name_cache()
+    logging.info("Found %s installed games", len(installed_games))
     return installed_games
 
 
+def _parse_epic_manifest(path: str) -> Optional[Dict]:
+    """One Epic .item manifest -> { "name", "exe_path", "app_name" }, or None if unusable."""
+    try:
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
+        app_name = data.get("AppName")
+        display_name = data.get("DisplayName") or app_name or "Unknown"
+        install_location = data.get("InstallLocation", "")
+        launch_exe = data.get("LaunchExecutable", "")
+        if not app_name:
+            return None
+        exe_path = ""
+        if install_location and launch_exe:
+            exe_path = os.path.join(install_location, launch_exe)
+            if not os.path.isfile(exe_path):
+                exe_path = ""
+        return {
+            "name": display_name,
+            "exe_path": exe_path,
+            "app_name": app_name,
+        }
+    except Exception as e:
+        logging.debug("Skip Epic manifest %s: %s", path, e)
+        return None
+
+
 def load_installed_epic_games(manifests_path: str) -> Dict[str, Dict]:
     """
     Load installed Epic Games Store games from .item manifest files.
     Returns dict keyed by AppName: { "name": DisplayName, "exe_path": full path to exe, "app_name": AppName }.
     """
-    if not manifests_path or not os.path.isdir(manifests_path):
+    if not manifests_path:
+        logging.debug("Epic manifests path not set or not a directory, skipping Epic")
+        return {}
+    try:
+        with os.scandir(manifests_path) as entries:
+            paths = sorted(e.path for e in entries if e.name.lower().endswith(".item") and e.is_file())
+    except OSError:
         logging.debug("Epic manifests path not set or not a directory, skipping Epic")
         return {}
     installed = {}
-    for path in glob.glob(os.path.join(manifests_path, "*.item")):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            app_name = data.get("AppName")
-            display_name = data.get("DisplayName") or app_name or "Unknown"
-            install_location = data.get("InstallLocation", "")
-            launch_exe = data.get("LaunchExecutable", "")
-            if not app_name:
-                continue
-            exe_path = ""
-            if install_location and launch_exe:
-                exe_path = os.path.join(install_location, launch_exe)
-                if not os.path.isfile(exe_path):
-                    exe_path = ""
-            installed[app_name] = {
-                "name": display_name,
-                "exe_path": exe_path,
-                "app_name": app_name,
-            }
-        except Exception as e:
-            logging.debug(f"Skip Epic manifest {path}: {e}")
-    logging.info(f"Found {len(installed)} installed Epic games")
+    # Manifests are independent small files: read and parse them (and stat their exes) concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for info in executor.map(_parse_epic_manifest, paths):
+            if info:
+                installed[info["app_name"]] = info
+    logging.info("Found %s installed Epic games", len(installed))
     return installed
 
 
@@ -639,8 +1337,8 @@ def load_custom_games(json_path: str) -> List[Dict]:
     if not json_path or not os.path.isfile(json_path):
         return []
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = _json_loads(f.read())
         games = data.get("games") or data.get("custom_games") or []
         out = []
         for g in games:
@@ -650,10 +1348,10 @@ def load_custom_games(json_path: str) -> List[Dict]:
                     "cmd": g["cmd"].strip(),
                     "image_path": (g.get("image_path") or "").strip(),
                 })
-        logging.info(f"Loaded {len(out)} custom game(s) from {json_path}")
+        logging.info("Loaded %s custom game(s) from %s", len(out), json_path)
         return out
     except Exception as e:
-        logging.warning(f"Could not load custom games from {json_path}: {e}")
+        logging.warning("Could not load custom games from %s: %s", json_path, e)
         return []
 
 
@@ -735,10 +1433,40 @@ def _parse_microsoft_game_config(config_path: str, game_root: str) -> Optional[T
         if display_name and exe_name:
             return (display_name.strip(), exe_name.strip())
     except Exception as e:
-        logging.debug(f"Parse MicrosoftGame.config {config_path}: {e}")
+        logging.debug("Parse MicrosoftGame.config %s: %s", config_path, e)
     return None
 
 
+def _process_one_xbox_dir(entry: str, game_dir: str) -> Optional[Tuple[str, str]]:
+    """Resolve (display name, normalized exe path) for one Xbox game folder, or None if no exe is found."""
+    config_path = os.path.join(game_dir, "MicrosoftGame.config")
+    display_name = None
+    exe_name = None
+    if os.path.isfile(config_path):
+        parsed = _parse_microsoft_game_config(config_path, game_dir)
+        if parsed:
+            display_name, exe_name = parsed
+    if exe_name:
+        # Search recursively for exe_name (e.g. in Binaries/Win64/Game.exe); skips helpers like GameLaunchHelper
+        exe_path = _find_exe_in_tree(game_dir, exe_name)
+    else:
+        exe_path = None
+    if not exe_path:
+        # Fallback: search recursively for any .exe (e.g. when config listed only GameLaunchHelper)
+        found = _find_any_exe_in_tree(game_dir)
+        if found:
+            exe_path, display_from_file = found
+            if not display_name:
+                display_name = display_from_file
+    if not display_name:
+        display_name = entry
+    if not exe_path or not os.path.isfile(exe_path):
+        return None
+    if os.path.basename(exe_path).lower() == "minecraft.windows.exe":
+        display_name = "Minecraft for Windows"
+    return display_name, os.path.normpath(exe_path)
+
+
 def load_installed_xbox_games(folders_str: str) -> Dict[str, Dict]:
     """
     Discover Xbox/Windows Store (Game Pass) games from usual install folders (e.g. C:\\XboxGames).
@@ -751,165 +1479,256 @@ def load_installed_xbox_games(folders_str: str) -> Dict[str, Dict]:
     installed = {}
     for root_dir in roots:
         if not os.path.isdir(root_dir):
-            logging.debug(f"Xbox games root not found: {root_dir}")
+            logging.debug("Xbox games root not found: %s", root_dir)
             continue
-        for entry in os.listdir(root_dir):
-            game_dir = os.path.join(root_dir, entry)
-            if not os.path.isdir(game_dir):
-                continue
-            config_path = os.path.join(game_dir, "MicrosoftGame.config")
-            display_name = None
-            exe_name = None
-            if os.path.isfile(config_path):
-                parsed = _parse_microsoft_game_config(config_path, game_dir)
-                if parsed:
-                    display_name, exe_name = parsed
-            if exe_name:
-                # Search recursively for exe_name (e.g. in Binaries/Win64/Game.exe); skips helpers like GameLaunchHelper
-                exe_path = _find_exe_in_tree(game_dir, exe_name)
-            else:
-                exe_path = None
-            if not exe_path:
-                # Fallback: search recursively for any .exe (e.g. when config listed only GameLaunchHelper)
-                found = _find_any_exe_in_tree(game_dir)
+        with os.scandir(root_dir) as entries:
+            game_dirs = [(e.name, e.path) for e in entries if e.is_dir()]
+        if not game_dirs:
+            continue
+        # Each folder is a config parse plus a directory walk; threads overlap the disk latency
+        with ThreadPoolExecutor(max_workers=min(16, len(game_dirs))) as executor:
+            for found in executor.map(lambda d: _process_one_xbox_dir(*d), game_dirs):
                 if found:
-                    exe_path, display_from_file = found
-                    if not display_name:
-                        display_name = display_from_file
-            if not display_name:
-                display_name = entry
-            if not exe_path or not os.path.isfile(exe_path):
-                continue
-            if os.path.basename(exe_path).lower() == "minecraft.windows.exe":
-                display_name = "Minecraft for Windows"
-            exe_path_norm = os.path.normpath(exe_path)
-            installed[exe_path_norm] = {"name": display_name, "cmd": exe_path_norm}
-    logging.info(f"Found {len(installed)} Xbox/Windows games")
+                    display_name, exe_path_norm = found
+                    installed[exe_path_norm] = {"name": display_name, "cmd": exe_path_norm}
+    logging.info("Found %s Xbox/Windows games", len(installed))
     return installed
 
 
+# Steam entries as written by add_new_games: the bare URI (Windows) or via steam / Flatpak Steam (Linux)
+_STEAM_RUN_CMD_RE = re.compile(r'(?:(?:flatpak run com\.valvesoftware\.Steam|steam) )?steam://rungameid/([^/?\s]+)')
+
+
+def configured_steam_names(sunshine_config: Dict) -> Dict[str, str]:
+    """AppID -> app name for the Steam games already in the Sunshine config."""
+    names = {}
+    for app in sunshine_config.get('apps', []):
+        match = _STEAM_RUN_CMD_RE.match((app.get('cmd') or '').strip())
+        if match and app.get('name'):
+            names[match.group(1)] = app['name']
+    return names
+
+
+# AppName in an Epic launch URI: com.epicgames.launcher://apps/AppName?action=...
+_EPIC_APP_RE = re.compile(r'com\.epicgames\.launcher://apps/([^?/\s]+)')
+
+
+def _norm_cmd(cmd: str) -> str:
+    """Comparison key for an app cmd: path-like commands are normpath'ed, anything else is kept as is."""
+    if os.path.sep in cmd or (os.path.altsep and os.path.altsep in cmd):
+        return os.path.normpath(cmd)
+    return cmd
+
+
 def process_existing_apps(
     sunshine_config: Dict,
     installed_games: Dict[str, str],
     installed_epic: Optional[Dict[str, Dict]] = None,
-    custom_cmds: Optional[Set[str]] = None,
     installed_xbox: Optional[Dict[str, Dict]] = None,
     shortcuts_folder: Optional[str] = None,
-) -> Tuple[List[Dict], List[Tuple[str, str]], List[Tuple[str, str]], Set[str], Set[str], Set[str]]:
-    """Process existing Sunshine apps and identify changes. Returns (updated_apps, removed_steam, removed_epic, existing_steam_ids, existing_epic_ids, existing_xbox_cmds)."""
+    grids_folder: Optional[str] = None,
+) -> Tuple[List[Dict], List[Tuple[str, str]], List[Tuple[str, str]], List[str], List[str], Set[str], Set[str], Set[str], Set[str]]:
+    """
+    Process existing Sunshine apps and identify changes. Returns (updated_apps, removed_steam, removed_epic, removed_shortcuts, stale_grids, existing_steam_ids, existing_epic_ids, existing_xbox_cmds, retained_cmds).
+    removed_shortcuts names the apps dropped because their generated .lnk is gone.
+    stale_grids are grid images of removed apps (plus <grids_folder>/<app_id>.png of removed Steam games); nothing
+    is deleted here, the caller passes them to _remove_grid_images once the new config is saved.
+    retained_cmds holds the kept apps' cmds normalized with _norm_cmd, plus the exe targets of kept shortcuts.
+    installed_xbox keys must already be normalized (see _norm_cmd), so each app costs one normpath.
+    Custom apps are always kept; main() compares them against retained_cmds to find new ones.
+    """
     updated_apps = []
+    stale_grids: List[str] = []
     removed_steam = []
     removed_epic: List[Tuple[str, str]] = []
+    removed_shortcuts: List[str] = []
     existing_steam_apps: Set[str] = set()
     existing_epic_apps: Set[str] = set()
     existing_xbox_cmds: Set[str] = set()
+    retained_cmds: Set[str] = set()
     installed_epic = installed_epic or {}
-    custom_cmds = custom_cmds or set()
     installed_xbox = installed_xbox or {}
-    shortcuts_folder_norm = os.path.normpath(shortcuts_folder) if shortcuts_folder else ""
+    # Trailing separator, so C:\Shortcuts2\x.lnk is not taken to be inside C:\Shortcuts
+    shortcuts_folder_norm = os.path.join(os.path.normpath(shortcuts_folder), '') if shortcuts_folder else ""
 
-    def _delete_shortcut_if_in_folder(shortcut_path: Optional[str]) -> None:
-        if not shortcut_path or not shortcuts_folder_norm:
-            return
-        p = os.path.normpath(shortcut_path)
-        if p.startswith(shortcuts_folder_norm) and os.path.isfile(p):
-            try:
-                os.remove(p)
-                logging.debug(f"Removed shortcut: {p}")
-            except Exception as e:
-                logging.warning(f"Failed to remove shortcut {p}: {e}")
+    def _delete_shortcut_if_in_folder(shortcut_path: str) -> None:
+        # Callers pass a normalized path already checked to be inside shortcuts_folder_norm
+        try:
+            os.remove(shortcut_path)
+            logging.debug("Removed shortcut: %s", shortcut_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Failed to remove shortcut %s: %s", shortcut_path, e)
+
+    def _keep(app: Dict, *cmd_keys: str) -> None:
+        updated_apps.append(app)
+        retained_cmds.update(cmd_keys)
+
+    def _track_epic_app(app: Dict, cmd: str, app_name: str, shortcut_path: Optional[str] = None) -> None:
+        if app_name in installed_epic:
+            _keep(app, _norm_cmd(cmd))
+            existing_epic_apps.add(app_name)
+        else:
+            removed_epic.append((app.get('name', 'Unknown'), app_name))
+            if shortcut_path:
+                _delete_shortcut_if_in_folder(shortcut_path)
+            if app.get('image-path'):
+                stale_grids.append(app['image-path'])
 
     for app in sunshine_config.get('apps', []):
         cmd = (app.get('cmd') or '').strip()
-        cmd_norm = os.path.normpath(cmd) if os.path.sep in cmd else cmd
-        shortcut_path = _extract_shortcut_path_from_cmd(cmd) if shortcuts_folder_norm else None
-        if shortcut_path and shortcuts_folder_norm and shortcut_path.startswith(shortcuts_folder_norm):
+        # A shortcut inside shortcuts_folder_norm always contains a separator, so on Windows
+        # steam:// and Epic URIs skip the shortcut parse entirely
+        shortcut_path = _extract_shortcut_path_from_cmd(cmd) if shortcuts_folder_norm and os.path.sep in cmd else None
+        if shortcut_path and shortcut_path.startswith(shortcuts_folder_norm):
+            if os.name == 'nt' and not os.path.isfile(shortcut_path):
+                # Our .lnk is gone, so the entry cannot launch: drop it without a COM call. A game that
+                # is still installed is then re-added by main() with a new shortcut (reusing its grid)
+                removed_shortcuts.append(app.get('name', 'Unknown'))
+                if app.get('image-path'):
+                    stale_grids.append(app['image-path'])
+                continue
             target = _read_shortcut_target_win(shortcut_path)
-            if target and 'com.epicgames.launcher://' in target:
-                try:
-                    prefix = "com.epicgames.launcher://apps/"
-                    idx = target.find(prefix)
-                    if idx != -1:
-                        app_name = target[idx + len(prefix):].split('?')[0].split('/')[0].strip()
-                        if app_name in installed_epic:
-                            updated_apps.append(app)
-                            existing_epic_apps.add(app_name)
-                        else:
-                            removed_epic.append((app.get('name', 'Unknown'), app_name))
-                            _delete_shortcut_if_in_folder(shortcut_path)
-                            grid_path = app.get('image-path')
-                            if grid_path and os.path.exists(grid_path):
-                                try:
-                                    os.remove(grid_path)
-                                    logging.debug(f"Removed grid image: {grid_path}")
-                                except Exception as e:
-                                    logging.warning(f"Failed to remove grid image {grid_path}: {e}")
-                    else:
-                        updated_apps.append(app)
-                except Exception:
-                    updated_apps.append(app)
+            epic_match = _EPIC_APP_RE.search(target) if target else None
+            if epic_match:
+                _track_epic_app(app, cmd, epic_match.group(1), shortcut_path)
             elif target and os.path.sep in target:
+                # Xbox, custom and any other exe shortcuts are kept; the target lets main() match custom games
                 target_norm = os.path.normpath(target)
-                if target_norm in installed_xbox or target in installed_xbox:
-                    updated_apps.append(app)
-                    existing_xbox_cmds.add(target_norm if target_norm in installed_xbox else target)
-                elif target in custom_cmds or target_norm in custom_cmds:
-                    updated_apps.append(app)
-                else:
-                    updated_apps.append(app)
+                if target_norm in installed_xbox:
+                    existing_xbox_cmds.add(target_norm)
+                _keep(app, _norm_cmd(cmd), target_norm)
             else:
-                updated_apps.append(app)
+                _keep(app, _norm_cmd(cmd))
             continue
-        if cmd.startswith('steam://rungameid/'):
-            app_id = cmd.split('/')[-1].split('?')[0]
+        steam_match = _STEAM_RUN_CMD_RE.match(cmd)
+        if steam_match:
+            app_id = steam_match.group(1)
             if app_id in installed_games:
-                updated_apps.append(app)
+                _keep(app, _norm_cmd(cmd))
                 existing_steam_apps.add(app_id)
             else:
                 removed_steam.append((app.get('name', 'Unknown'), app_id))
-                grid_path = app.get('image-path')
-                if grid_path and os.path.exists(grid_path):
-                    try:
-                        os.remove(grid_path)
-                        logging.debug(f"Removed grid image: {grid_path}")
-                    except Exception as e:
-                        logging.warning(f"Failed to remove grid image {grid_path}: {e}")
+                if app.get('image-path'):
+                    stale_grids.append(app['image-path'])
+                if grids_folder:
+                    stale_grids.append(os.path.join(grids_folder, f"{app_id}.png"))
         elif 'com.epicgames.launcher://' in cmd:
-            # Extract AppName: com.epicgames.launcher://apps/AppName?action=...
-            try:
-                prefix = "com.epicgames.launcher://apps/"
-                idx = cmd.find(prefix)
-                if idx != -1:
-                    rest = cmd[idx + len(prefix):]
-                    app_name = rest.split('?')[0].split('/')[0].strip()
-                    if app_name in installed_epic:
-                        updated_apps.append(app)
-                        existing_epic_apps.add(app_name)
-                    else:
-                        removed_epic.append((app.get('name', 'Unknown'), app_name))
-                        grid_path = app.get('image-path')
-                        if grid_path and os.path.exists(grid_path):
-                            try:
-                                os.remove(grid_path)
-                                logging.debug(f"Removed grid image: {grid_path}")
-                            except Exception as e:
-                                logging.warning(f"Failed to remove grid image {grid_path}: {e}")
-                else:
-                    updated_apps.append(app)
-            except Exception:
-                updated_apps.append(app)
-        elif cmd_norm in installed_xbox:
-            updated_apps.append(app)
-            existing_xbox_cmds.add(cmd_norm)
-        elif cmd in installed_xbox:
-            updated_apps.append(app)
-            existing_xbox_cmds.add(cmd)
-        elif cmd in custom_cmds:
-            updated_apps.append(app)
+            epic_match = _EPIC_APP_RE.search(cmd)
+            if epic_match:
+                _track_epic_app(app, cmd, epic_match.group(1))
+            else:
+                _keep(app, _norm_cmd(cmd))
         else:
-            updated_apps.append(app)
+            # Only exe paths are left; normalize just these
+            cmd_norm = _norm_cmd(cmd)
+            if cmd_norm in installed_xbox:
+                existing_xbox_cmds.add(cmd_norm)
+            _keep(app, cmd_norm)
+
+    return (updated_apps, removed_steam, removed_epic, removed_shortcuts, stale_grids,
+            existing_steam_apps, existing_epic_apps, existing_xbox_cmds, retained_cmds)
+
+
+def _remove_grid_images(stale_grids: List[str], grids_folder: str, kept_apps: List[Dict]) -> None:
+    """
+    Delete the grid images of removed apps. Only files inside grids_folder are touched (a custom game's own
+    image_path is left alone), and none that an app in the saved config still uses: a re-added game
+    (new shortcut, same stable id) picks its old grid up again.
+    """
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    folder_key = _key(grids_folder)
+    kept_images = {_key(app['image-path']) for app in kept_apps if app.get('image-path')}
+    to_delete: Dict[str, str] = {}
+    for grid_path in stale_grids:
+        key = _key(grid_path)
+        if os.path.dirname(key) == folder_key and key not in kept_images:
+            to_delete.setdefault(key, grid_path)
+    _unlink_all(list(to_delete.values()))
+
+
+_UNLINK_WORKERS = 16
+
+
+def _unlink_all(paths: List[str], label: str = "grid image") -> None:
+    """Delete paths, ignoring ones already gone; several at once, as each delete mostly waits on the OS/antivirus."""
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+            logging.debug("Removed %s: %s", label, path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning("Failed to remove %s %s: %s", label, path, e)
+
+    if len(paths) < 2:
+        for path in paths:
+            _unlink(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(_UNLINK_WORKERS, len(paths))) as executor:
+        list(executor.map(_unlink, paths))
+
+
+def _existing_grid_files(grids_folder: str) -> Dict[str, str]:
+    """Non-empty files in grids_folder (name -> path) from a single directory scan; {} if unreadable."""
+    try:
+        with os.scandir(grids_folder) as entries:
+            return {
+                entry.name: entry.path
+                for entry in entries
+                if entry.is_file() and entry.stat().st_size > 0
+            }
+    except OSError:
+        return {}
+
+
+# Fields that are the same for every app entry this tool writes (apps.json key order is kept)
+_APP_ENTRY_DEFAULTS = {
+    "output": "",
+    "detached": "",
+    "elevated": "false",
+    "hidden": "true",
+    "wait-all": "true",
+    "exit-timeout": "5",
+}
+
+
+def _log_added(kind: str, new_apps: List[Dict]) -> None:
+    """One summary line for a batch of added apps instead of a line per game."""
+    if new_apps:
+        logging.info("Added %d %s game(s): %s", len(new_apps), kind, ", ".join(app["name"] for app in new_apps))
+
+
+_steam_cmd_template_cache: Optional[str] = None
+
+
+def _steam_cmd_template() -> str:
+    """
+    Launch command for a Steam game, with an {app_id} placeholder. Works out once per process
+    whether Steam is the Flatpak build (Linux), instead of running `flatpak list` per game.
+    """
+    global _steam_cmd_template_cache
+    if _steam_cmd_template_cache is None:
+        if os.name == 'nt':
+            template = "steam://rungameid/{app_id}"
+        else:
+            try:
+                flatpak_apps = subprocess.run(
+                    ['flatpak', 'list', '--app', '--columns=application'],
+                    capture_output=True, text=True
+                ).stdout
+            except OSError:  # flatpak not installed
+                flatpak_apps = ''
+            if 'com.valvesoftware.Steam' in flatpak_apps:
+                template = "flatpak run com.valvesoftware.Steam steam://rungameid/{app_id}"
+            else:
+                template = "steam steam://rungameid/{app_id}"
+        _steam_cmd_template_cache = template
+    return _steam_cmd_template_cache
 
-    return updated_apps, removed_steam, removed_epic, existing_steam_apps, existing_epic_apps, existing_xbox_cmds
 
 def add_new_games(new_games: Set[str], installed_games: Dict[str, str], api_key: str, grids_folder: str) -> List[Dict]:
     """Add new games with grid images using concurrent downloads."""
@@ -918,60 +1737,68 @@ def add_new_games(new_games: Set[str], installed_games: Dict[str, str], api_key:
     if not new_games:
         return new_apps
     
-    logging.info(f"Adding {len(new_games)} new games...")
+    logging.info("Adding %s new games...", len(new_games))
+    cmd_template = _steam_cmd_template()
     
-    # Download grids concurrently
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_app_id = {}
-        
-        for app_id in new_games:
-            future = executor.submit(fetch_grid, app_id, api_key or '', grids_folder)
-            future_to_app_id[future] = app_id
+    # Reuse grids already on disk (e.g. apps.json was regenerated) instead of downloading them again
+    on_disk = {} if REFRESH_ART else _existing_grid_files(grids_folder)
+    grid_paths = {app_id: on_disk[f"{app_id}.png"] for app_id in new_games if f"{app_id}.png" in on_disk}
+    if grid_paths:
+        logging.info("Reusing %s existing grid images", len(grid_paths))
+    
+    def _add(app_id: str, grid_path: Optional[str]) -> None:
+        game_name = installed_games[app_id]
+        new_app = {
+            "name": game_name,
+            "cmd": cmd_template.format(app_id=app_id),
+            **_APP_ENTRY_DEFAULTS,
+            "image-path": grid_path or ""
+        }
+        new_apps.append(new_app)
+    
+    processed = 0
+    for app_id, grid_path in grid_paths.items():
+        processed += 1
+        try:
+            _add(app_id, grid_path)
+        except Exception as e:
+            logging.error("Error processing new game %s: %s", app_id, e)
+    
+    to_fetch = [app_id for app_id in new_games if app_id not in grid_paths]
+    api_key = (api_key or '').strip()
+    # One SteamGridDB lookup per STEAMGRIDDB_BULK_SIZE games instead of one per game
+    grid_urls = fetch_steamgriddb_grid_urls(to_fetch, api_key) if api_key and to_fetch else {}
+    
+    def _fetch(app_id: str) -> Optional[str]:
+        if app_id not in grid_urls:
+            return fetch_grid(app_id, api_key, grids_folder)  # no key, or the bulk lookup failed
+        grid_url = grid_urls[app_id]
+        path = _download_steamgriddb_grid(grid_url, app_id, grids_folder) if grid_url else None
+        if path:
+            return path
+        logging.debug("SteamGridDB failed for %s, trying Steam CDN", app_id)
+        return fetch_grid_from_steam_cdn(app_id, grids_folder)
+    
+    # Download the remaining grids concurrently; per-host limiters keep SteamGridDB/Store traffic polite
+    with ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE) as executor:
+        future_to_app_id = {executor.submit(_fetch, app_id): app_id for app_id in to_fetch}
         
-        processed = 0
+        last_progress = time.monotonic()
         for future in as_completed(future_to_app_id):
             app_id = future_to_app_id[future]
             processed += 1
             
             try:
-                grid_path = future.result()
-                game_name = installed_games[app_id]
-                
-                # Determine command based on platform
-                if os.name == 'nt':
-                    cmd = f"steam://rungameid/{app_id}"
-                else:
-                    # Check for Flatpak Steam
-                    flatpak_steam = subprocess.run(
-                        ['flatpak', 'list', '--app', '--columns=application'], 
-                        capture_output=True, text=True
-                    ).stdout
-                    
-                    if 'com.valvesoftware.Steam' in flatpak_steam:
-                        cmd = f"flatpak run com.valvesoftware.Steam steam://rungameid/{app_id}"
-                    else:
-                        cmd = f"steam steam://rungameid/{app_id}"
-                
-                new_app = {
-                    "name": game_name,
-                    "cmd": cmd,
-                    "output": "",
-                    "detached": "",
-                    "elevated": "false",
-                    "hidden": "true",
-                    "wait-all": "true",
-                    "exit-timeout": "5",
-                    "image-path": grid_path or ""
-                }
-                new_apps.append(new_app)
-                logging.info(f"Added: {game_name}")
-                
+                _add(app_id, future.result())
             except Exception as e:
-                logging.error(f"Error processing new game {app_id}: {e}")
+                logging.error("Error processing new game %s: %s", app_id, e)
             
-            if processed % 10 == 0 or processed == len(new_games):
-                logging.info(f"Processed {processed}/{len(new_games)} new games...")
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_LOG_INTERVAL or processed == len(new_games):
+                logging.info("Processed %d/%d new games...", processed, len(new_games))
+                last_progress = now
     
+    _log_added("Steam", new_apps)
     return new_apps
 
 
@@ -994,39 +1821,39 @@ def add_epic_games(
     new_apps = []
     if not new_epic_ids:
         return new_apps
-    logging.info(f"Adding {len(new_epic_ids)} Epic game(s)...")
-    for app_name in new_epic_ids:
+    logging.info("Adding %s Epic game(s)...", len(new_epic_ids))
+    safe_ids = {
+        app_name: "epic_" + "".join(c if c.isalnum() or c in "._-" else "_" for c in app_name)
+        for app_name in new_epic_ids if installed_epic.get(app_name)
+    }
+    grids = fetch_grids_by_name(
+        {app_name: (installed_epic[app_name]["name"], safe_id) for app_name, safe_id in safe_ids.items()},
+        api_key, grids_folder,
+    )
+    shortcut_paths: Dict[str, str] = {}
+    created: Set[str] = set()
+    if shortcuts_folder and os.name == 'nt' and safe_ids:
+        os.makedirs(shortcuts_folder, exist_ok=True)
+        shortcut_paths = {app_name: os.path.join(shortcuts_folder, safe_id + ".lnk") for app_name, safe_id in safe_ids.items()}
+        created = _create_shortcuts_win([
+            (shortcut_paths[app_name], f"com.epicgames.launcher://apps/{app_name}?action=launch&silent=true", None)
+            for app_name in safe_ids
+        ])
+    for app_name in safe_ids:
         try:
-            info = installed_epic.get(app_name)
-            if not info:
-                continue
-            game_name = info["name"]
-            safe_id = "epic_" + "".join(c if c.isalnum() or c in "._-" else "_" for c in app_name)
-            grid_path = fetch_grid_by_name(game_name, api_key or '', grids_folder, safe_id)
-            epic_url = f"com.epicgames.launcher://apps/{app_name}?action=launch&silent=true"
-            if shortcuts_folder and os.name == 'nt':
-                os.makedirs(shortcuts_folder, exist_ok=True)
-                shortcut_path = os.path.join(shortcuts_folder, safe_id + ".lnk")
-                if _create_shortcut_win(shortcut_path, epic_url):
-                    cmd = _shortcut_launch_cmd(shortcut_path)
-                else:
-                    cmd = _epic_launch_cmd(app_name)
-            else:
-                cmd = _epic_launch_cmd(app_name)
+            game_name = installed_epic[app_name]["name"]
+            grid_path = grids.get(app_name)
+            shortcut_path = shortcut_paths.get(app_name)
+            cmd = _shortcut_launch_cmd(shortcut_path) if shortcut_path in created else _epic_launch_cmd(app_name)
             new_apps.append({
                 "name": game_name,
                 "cmd": cmd,
-                "output": "",
-                "detached": "",
-                "elevated": "false",
-                "hidden": "true",
-                "wait-all": "true",
-                "exit-timeout": "5",
+                **_APP_ENTRY_DEFAULTS,
                 "image-path": grid_path or "",
             })
-            logging.info(f"Added Epic: {game_name}")
         except Exception as e:
-            logging.error(f"Error adding Epic game {app_name}: {e}")
+            logging.error("Error adding Epic game %s: %s", app_name, e)
+    _log_added("Epic", new_apps)
     return new_apps
 
 
@@ -1037,40 +1864,46 @@ def add_custom_games(
     grids_folder: str,
     shortcuts_folder: Optional[str] = None,
 ) -> List[Dict]:
-    """Add custom games (from JSON) that are not already in config. If shortcuts_folder set (Windows), create .lnk and use that as cmd."""
+    """
+    Add custom games (from JSON) that are not already in config. If shortcuts_folder set (Windows), create .lnk and use that as cmd.
+    existing_cmds holds the configured cmds normalized with _norm_cmd.
+    """
     new_apps = []
+    pending = []
     for g in custom_list:
         exe_cmd = g.get("cmd", "").strip()
-        if not exe_cmd or exe_cmd in existing_cmds:
+        if not exe_cmd or _norm_cmd(exe_cmd) in existing_cmds:
             continue
         name = (g.get("name") or "").strip() or "Custom Game"
-        image_path = (g.get("image_path") or "").strip()
-        if not image_path:
-            safe_id = "custom_" + str(abs(hash(exe_cmd)))[:12]
-            image_path = fetch_grid_by_name(name, api_key or '', grids_folder, safe_id) or ""
-        if shortcuts_folder and os.name == 'nt' and os.path.sep in exe_cmd and os.path.isfile(exe_cmd):
+        pending.append((exe_cmd, name, (g.get("image_path") or "").strip()))
+    # Look up art for every game without an image_path at once
+    grids = fetch_grids_by_name(
+        {exe_cmd: (name, _stable_id("custom_", exe_cmd)) for exe_cmd, name, image_path in pending if not image_path},
+        api_key, grids_folder,
+    )
+    shortcut_paths: Dict[str, str] = {}
+    created: Set[str] = set()
+    if shortcuts_folder and os.name == 'nt':
+        shortcut_paths = {
+            exe_cmd: os.path.join(shortcuts_folder, _stable_id("custom_", exe_cmd) + ".lnk")
+            for exe_cmd, _name, _image in pending
+            if os.path.sep in exe_cmd and os.path.isfile(exe_cmd)
+        }
+        if shortcut_paths:
             os.makedirs(shortcuts_folder, exist_ok=True)
-            safe_id = "custom_" + str(abs(hash(exe_cmd)))[:12]
-            shortcut_path = os.path.join(shortcuts_folder, safe_id + ".lnk")
-            work_dir = os.path.dirname(exe_cmd)
-            if _create_shortcut_win(shortcut_path, exe_cmd, work_dir):
-                cmd = _shortcut_launch_cmd(shortcut_path)
-            else:
-                cmd = exe_cmd
-        else:
-            cmd = exe_cmd
+            created = _create_shortcuts_win([(p, exe_cmd, os.path.dirname(exe_cmd)) for exe_cmd, p in shortcut_paths.items()])
+    for exe_cmd, name, image_path in pending:
+        if not image_path:
+            image_path = grids.get(exe_cmd) or ""
+        shortcut_path = shortcut_paths.get(exe_cmd)
+        cmd = _shortcut_launch_cmd(shortcut_path) if shortcut_path in created else exe_cmd
         new_apps.append({
             "name": name,
             "cmd": cmd,
-            "output": "",
-            "detached": "",
-            "elevated": "false",
-            "hidden": "true",
-            "wait-all": "true",
-            "exit-timeout": "5",
+            **_APP_ENTRY_DEFAULTS,
             "image-path": image_path,
         })
-        logging.info(f"Added custom: {name}")
+    _log_added("custom", new_apps)
     return new_apps
 
 
@@ -1085,39 +1918,40 @@ def add_xbox_games(
     new_apps = []
     if not new_xbox_cmds:
         return new_apps
-    logging.info(f"Adding {len(new_xbox_cmds)} Xbox/Windows game(s)...")
-    for exe_path in new_xbox_cmds:
-        info = installed_xbox.get(exe_path)
-        if not info:
-            continue
+    logging.info("Adding %s Xbox/Windows game(s)...", len(new_xbox_cmds))
+    safe_ids = {
+        exe_path: _stable_id("xbox_", exe_path)
+        for exe_path in new_xbox_cmds if installed_xbox.get(exe_path)
+    }
+    grids = fetch_grids_by_name(
+        {exe_path: (installed_xbox[exe_path]["name"], safe_id) for exe_path, safe_id in safe_ids.items()},
+        api_key, grids_folder,
+    )
+    shortcut_paths: Dict[str, str] = {}
+    created: Set[str] = set()
+    if shortcuts_folder and os.name == 'nt':
+        shortcut_paths = {
+            exe_path: os.path.join(shortcuts_folder, safe_id + ".lnk")
+            for exe_path, safe_id in safe_ids.items() if os.path.isfile(exe_path)
+        }
+        if shortcut_paths:
+            os.makedirs(shortcuts_folder, exist_ok=True)
+            created = _create_shortcuts_win([(p, exe_path, os.path.dirname(exe_path)) for exe_path, p in shortcut_paths.items()])
+    for exe_path in safe_ids:
         try:
-            name = info["name"]
-            safe_id = "xbox_" + str(abs(hash(exe_path)))[:12]
-            grid_path = fetch_grid_by_name(name, api_key or '', grids_folder, safe_id)
-            if shortcuts_folder and os.name == 'nt' and os.path.isfile(exe_path):
-                os.makedirs(shortcuts_folder, exist_ok=True)
-                shortcut_path = os.path.join(shortcuts_folder, safe_id + ".lnk")
-                work_dir = os.path.dirname(exe_path)
-                if _create_shortcut_win(shortcut_path, exe_path, work_dir):
-                    cmd = _shortcut_launch_cmd(shortcut_path)
-                else:
-                    cmd = exe_path
-            else:
-                cmd = exe_path
+            name = installed_xbox[exe_path]["name"]
+            grid_path = grids.get(exe_path)
+            shortcut_path = shortcut_paths.get(exe_path)
+            cmd = _shortcut_launch_cmd(shortcut_path) if shortcut_path in created else exe_path
             new_apps.append({
                 "name": name,
                 "cmd": cmd,
-                "output": "",
-                "detached": "",
-                "elevated": "false",
-                "hidden": "true",
-                "wait-all": "true",
-                "exit-timeout": "5",
+                **_APP_ENTRY_DEFAULTS,
                 "image-path": grid_path or "",
             })
-            logging.info(f"Added Xbox/Windows: {name}")
         except Exception as e:
-            logging.error(f"Error adding Xbox game {exe_path}: {e}")
+            logging.error("Error adding Xbox game %s: %s", exe_path, e)
+    _log_added("Xbox/Windows", new_apps)
     return new_apps
 
 
@@ -1208,52 +2042,43 @@ def remove_all_apps_from_config(
     apps = config.get('apps', [])
     removed_count = len(apps)
 
-    # Delete thumbnails for removed apps when they live in our grids folder
+    # Delete thumbnails for removed apps when they live in our grids folder, plus any other
+    # PNGs there (orphaned thumbnails): one scan, one batch of parallel deletes
+    to_delete: Dict[str, str] = {}
     grids_folder_abs = os.path.abspath(grids_folder) if grids_folder else ""
-    for app in apps:
-        grid_path = app.get('image-path')
-        if grid_path and os.path.exists(grid_path):
-            if grids_folder_abs and os.path.abspath(os.path.dirname(grid_path)) == grids_folder_abs:
-                try:
-                    os.remove(grid_path)
-                    logging.debug(f"Removed grid image: {grid_path}")
-                except Exception as e:
-                    logging.warning(f"Failed to remove grid image {grid_path}: {e}")
-
-    # Remove any other PNGs in the grids folder (orphaned thumbnails)
-    if os.path.isdir(grids_folder):
+    if grids_folder_abs:
+        for app in apps:
+            grid_path = app.get('image-path')
+            if grid_path and os.path.abspath(os.path.dirname(grid_path)) == grids_folder_abs:
+                to_delete[os.path.normcase(os.path.abspath(grid_path))] = grid_path
         try:
-            for name in os.listdir(grids_folder):
-                if name.lower().endswith('.png'):
-                    path = os.path.join(grids_folder, name)
-                    try:
-                        os.remove(path)
-                        logging.debug(f"Removed grid image: {path}")
-                    except Exception as e:
-                        logging.warning(f"Failed to remove {path}: {e}")
+            with os.scandir(grids_folder) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.png') and entry.is_file():
+                        to_delete.setdefault(os.path.normcase(os.path.abspath(entry.path)), entry.path)
+        except FileNotFoundError:
+            pass
         except OSError as e:
-            logging.warning(f"Could not list grids folder {grids_folder}: {e}")
+            logging.warning("Could not list grids folder %s: %s", grids_folder, e)
+    _unlink_all(list(to_delete.values()))
 
     # Remove all generated shortcuts when using a shortcuts folder
-    if shortcuts_folder and os.path.isdir(shortcuts_folder):
+    if shortcuts_folder:
         try:
-            for name in os.listdir(shortcuts_folder):
-                if name.lower().endswith('.lnk'):
-                    path = os.path.join(shortcuts_folder, name)
-                    try:
-                        os.remove(path)
-                        logging.debug(f"Removed shortcut: {path}")
-                    except Exception as e:
-                        logging.warning(f"Failed to remove {path}: {e}")
+            with os.scandir(shortcuts_folder) as entries:
+                shortcuts = [e.path for e in entries if e.name.lower().endswith('.lnk') and e.is_file()]
+            _unlink_all(shortcuts, label="shortcut")
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         except OSError as e:
-            logging.warning(f"Could not list shortcuts folder {shortcuts_folder}: {e}")
+            logging.warning("Could not list shortcuts folder %s: %s", shortcuts_folder, e)
 
     # Restore stock defaults (Desktop, Steam Big Picture, Virtual Display for Apollo)
     default_apps = get_stock_default_apps(host)
     config['apps'] = default_apps
     save_sunshine_config(apps_json_path, config)
     default_names = [a.get('name', '') for a in default_apps]
-    logging.info(f"Removed {removed_count} app(s). Restored stock apps: {default_names}.")
+    logging.info("Removed %s app(s). Restored stock apps: %s.", removed_count, default_names)
     return removed_count
 
 
@@ -1264,8 +2089,15 @@ def main() -> None:
     parser.add_argument('--no-restart', action='store_true', help='Skip starting Steam (if not running) and skip restarting Sunshine/Apollo')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
     parser.add_argument('--remove-games', action='store_true', help='Remove all games (Steam + manually added); keep only stock apps Desktop, Steam, Virtual Display')
+    parser.add_argument('--strict-parse', action='store_true', help='Parse the Steam library VDF with the full vdf parser instead of the fast scan')
+    parser.add_argument('--validate-images', action='store_true', help='Fully verify downloaded grid images with PIL (slower)')
+    parser.add_argument('--refresh-art', action='store_true', help='Download grid images again even if they already exist')
     args = parser.parse_args()
     
+    global VALIDATE_IMAGES, REFRESH_ART
+    VALIDATE_IMAGES = args.validate_images
+    REFRESH_ART = args.refresh_art
+    
     # Setup logging
     setup_logging(args.verbose)
     logging.info("Starting Sunshine Steam Game Automation")
@@ -1273,13 +2105,19 @@ def main() -> None:
     try:
         # Load and validate configuration
         config = validate_config()
+        sgdb_workers = os.getenv('STEAMGRIDDB_MAX_WORKERS', '').strip()
+        if sgdb_workers:
+            try:
+                _HOST_LIMITERS['www.steamgriddb.com'].set_max_concurrent(min(int(sgdb_workers), HTTP_POOL_SIZE))
+            except ValueError:
+                logging.warning("Ignoring STEAMGRIDDB_MAX_WORKERS=%r: not a number", sgdb_workers)
         
         if args.remove_games:
             host_name = os.getenv("HOST", "sunshine").strip()
             if host_name.lower() not in ("sunshine", "apollo"):
                 host_name = "sunshine"
             host_name = host_name.capitalize()
-            logging.info(f"Removing all Steam games from {host_name}")
+            logging.info("Removing all Steam games from %s", host_name)
             removed = remove_all_apps_from_config(
                 config['SUNSHINE_APPS_JSON_PATH'],
                 config['SUNSHINE_GRIDS_FOLDER'],
@@ -1303,8 +2141,13 @@ def main() -> None:
         if not args.no_restart:
             ensure_steam_running(config['STEAM_EXE_PATH'])
         
+        # Load Sunshine configuration first: games already configured need no name lookup
+        sunshine_config = get_sunshine_config(config['SUNSHINE_APPS_JSON_PATH'])
+        
         # Load installed games (Steam)
-        installed_games = load_installed_games(config['STEAM_LIBRARY_VDF_PATH'])
+        installed_games = load_installed_games(
+            config['STEAM_LIBRARY_VDF_PATH'], args.strict_parse, known_names=configured_steam_names(sunshine_config)
+        )
         
         # Load Epic games (Windows only, if path set)
         installed_epic = {}
@@ -1313,49 +2156,46 @@ def main() -> None:
         
         # Load custom games (from JSON if path set)
         custom_list = load_custom_games(config.get('CUSTOM_GAMES_JSON_PATH', '') or '')
-        custom_cmds = {g["cmd"] for g in custom_list}
         
         # Load Xbox/Windows games from usual folders (e.g. C:\XboxGames)
         installed_xbox = {}
         if config.get('XBOX_GAMES_FOLDERS'):
             installed_xbox = load_installed_xbox_games(config['XBOX_GAMES_FOLDERS'])
         
-        # Load Sunshine configuration
-        sunshine_config = get_sunshine_config(config['SUNSHINE_APPS_JSON_PATH'])
-        
         # Ensure grids folder exists
         os.makedirs(config['SUNSHINE_GRIDS_FOLDER'], exist_ok=True)
         
         # Process existing apps (Steam, Epic, custom, Xbox)
         shortcuts_folder = config.get('SUNSHINE_SHORTCUTS_FOLDER') or ''
-        updated_apps, removed_steam, removed_epic, existing_steam_apps, existing_epic_apps, existing_xbox_cmds = process_existing_apps(
-            sunshine_config, installed_games, installed_epic, custom_cmds, installed_xbox, shortcuts_folder
+        (updated_apps, removed_steam, removed_epic, removed_shortcuts, stale_grids,
+         existing_steam_apps, existing_epic_apps, existing_xbox_cmds, existing_cmds) = process_existing_apps(
+            sunshine_config, installed_games, installed_epic, installed_xbox, shortcuts_folder,
+            grids_folder=config['SUNSHINE_GRIDS_FOLDER'],
         )
         
         # Find new games to add
-        new_games = set(installed_games.keys()) - existing_steam_apps
-        new_epic = set(installed_epic.keys()) - existing_epic_apps
-        new_xbox = set(installed_xbox.keys()) - existing_xbox_cmds
-        existing_cmds = {app.get('cmd', '').strip() for app in updated_apps}
-        existing_cmds_norm = {os.path.normpath(c) for c in existing_cmds if os.path.sep in c}
-        existing_cmds |= existing_cmds_norm
-        new_custom = [g for g in custom_list if g["cmd"].strip() not in existing_cmds and os.path.normpath(g["cmd"].strip()) not in existing_cmds]
+        new_games = installed_games.keys() - existing_steam_apps
+        new_epic = installed_epic.keys() - existing_epic_apps
+        new_xbox = installed_xbox.keys() - existing_xbox_cmds
+        new_custom = [g for g in custom_list if _norm_cmd(g["cmd"]) not in existing_cmds]
         
         # Log changes
         if removed_steam:
-            logging.info(f"Steam games to remove: {[name for name, _ in removed_steam]}")
+            logging.info("Steam games to remove: %s", [name for name, _ in removed_steam])
         if removed_epic:
-            logging.info(f"Epic games to remove: {[name for name, _ in removed_epic]}")
+            logging.info("Epic games to remove: %s", [name for name, _ in removed_epic])
+        if removed_shortcuts:
+            logging.info("Apps with a missing shortcut to remove: %s", removed_shortcuts)
         if new_games:
-            logging.info(f"New Steam games to add: {[installed_games[app_id] for app_id in new_games]}")
+            logging.info("New Steam games to add: %s", [installed_games[app_id] for app_id in new_games])
         if new_epic:
-            logging.info(f"New Epic games to add: {[installed_epic[aid]['name'] for aid in new_epic]}")
+            logging.info("New Epic games to add: %s", [installed_epic[aid]['name'] for aid in new_epic])
         if new_xbox:
-            logging.info(f"New Xbox/Windows games to add: {[installed_xbox[c]['name'] for c in new_xbox]}")
+            logging.info("New Xbox/Windows games to add: %s", [installed_xbox[c]['name'] for c in new_xbox])
         if new_custom:
-            logging.info(f"New custom games to add: {[g['name'] for g in new_custom]}")
+            logging.info("New custom games to add: %s", [g['name'] for g in new_custom])
         
-        if not removed_steam and not removed_epic and not new_games and not new_epic and not new_xbox and not new_custom:
+        if not removed_steam and not removed_epic and not removed_shortcuts and not new_games and not new_epic and not new_xbox and not new_custom:
             logging.info("No changes needed - all games are up to date")
             return
         
@@ -1380,6 +2220,9 @@ def main() -> None:
         sunshine_config['apps'] = updated_apps
         save_sunshine_config(config['SUNSHINE_APPS_JSON_PATH'], sunshine_config)
         
+        # Only now that the new config is saved (never on a dry run, which returned above) drop the removed apps' grids
+        _remove_grid_images(stale_grids, config['SUNSHINE_GRIDS_FOLDER'], updated_apps)
+        
         # Restart Sunshine after processing (unless disabled)
         if not args.no_restart:
             restart_sunshine(config['SUNSHINE_EXE_PATH'])
@@ -1401,8 +2244,12 @@ def main() -> None:
         logging.info("Process interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
         sys.exit(1)
+    finally:
+        # Push buffered records to the log file (the GUI may run several imports per process)
+        for handler in logging.getLogger().handlers:
+            handler.flush()
 
 if __name__ == "__main__":
     main()